@@ -7,11 +7,35 @@ Security:
 - party_id/customer_code have flexible validation (external IDs from accounting software)
 """
 
-from datetime import datetime
-from typing import List, Optional
+import logging
+from datetime import date, datetime
+from typing import Any, List, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+logger = logging.getLogger(__name__)
+
+
+def _parse_do_not_contact_until(v: Any) -> Any:
+    """
+    Leniently coerce a do_not_contact_until value to a date.
+
+    Django sends ISO strings (sometimes full datetimes). Empty or malformed
+    values are logged and ignored rather than failing the whole request, and
+    datetimes are cut down to their date.
+    """
+    if isinstance(v, datetime):
+        return v.date()
+    if not isinstance(v, str):
+        return v
+    if not v.strip():
+        return None
+    try:
+        return datetime.fromisoformat(v).date()
+    except ValueError:
+        logger.warning(f"Invalid do_not_contact_until date: {v}")
+        return None
+
 
 class EmailContent(BaseModel):
     """Email content for classification."""
@@ -40,11 +64,17 @@ class PartyInfo(BaseModel):
     tone_override: Optional[str] = None  # friendly, professional, firm (overrides brand_tone)
     grace_days_override: Optional[int] = None  # Overrides tenant grace_days
     touch_cap_override: Optional[int] = None  # Overrides tenant touch_cap
-    do_not_contact_until: Optional[str] = None  # ISO date YYYY-MM-DD
+    do_not_contact_until: Optional[date] = None  # ISO date YYYY-MM-DD
     monthly_touch_count: int = 0  # Touches this month (for monthly cap reset)
     is_verified: bool = True  # False for placeholder parties from unknown emails
     source: str = "sage"  # sage, email_inbound, manual
 
+    @field_validator("do_not_contact_until", mode="before")
+    @classmethod
+    def parse_do_not_contact_until(cls, v: Any) -> Any:
+        """Ignore empty/malformed hold dates and truncate datetimes to dates."""
+        return _parse_do_not_contact_until(v)
+
 
 class BehaviorInfo(BaseModel):
     """Historical payment behavior."""
@@ -149,7 +179,7 @@ class CaseContext(BaseModel):
     promise_grace_days: int = 3
 
     # Debtor-specific context (NEW - for gate evaluation and draft generation)
-    do_not_contact_until: Optional[str] = None  # ISO date if set (from party)
+    do_not_contact_until: Optional[date] = None  # ISO date if set (from party)
     monthly_touch_count: int = 0  # Current month's touch count (from party)
     relationship_tier: str = "standard"  # From party (vip, standard, high_risk)
     unsubscribe_requested: bool = False  # True if debtor opted out of communications
@@ -157,6 +187,12 @@ class CaseContext(BaseModel):
     # Industry context (NEW - for draft generation and gate evaluation)
     industry: Optional[IndustryInfo] = None
 
+    @field_validator("do_not_contact_until", mode="before")
+    @classmethod
+    def parse_do_not_contact_until(cls, v: Any) -> Any:
+        """Ignore empty/malformed hold dates and truncate datetimes to dates."""
+        return _parse_do_not_contact_until(v)
+
 
 # Dangerous patterns that indicate potential prompt injection
 PROMPT_INJECTION_PATTERNS = [
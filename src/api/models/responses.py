@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from datetime import date
 from typing import Any, Dict, List, Optional
 
@@ -60,8 +61,14 @@ class GenerateDraftResponse(BaseModel):
     is_fallback: bool = False
 
 
-class GateResult(BaseModel):
-    """Result of a single gate evaluation."""
+@dataclass(frozen=True, slots=True)
+class GateResult:
+    """
+    Result of a single gate evaluation.
+
+    A plain dataclass rather than a BaseModel: gate results are built by the
+    deterministic rule engine and need no validation, only serialization.
+    """
 
     passed: bool
     reason: str
@@ -74,6 +81,10 @@ class EvaluateGatesResponse(BaseModel):
 
     allowed: bool
     gate_results: Dict[str, GateResult]
+    # One bit per passed gate (see GATE_BITS in src.engine.gate_evaluator).
+    # Only meaningful for full reports: a blocked full_report=False evaluation
+    # leaves skipped gates unset, indistinguishable from failed ones
+    passed_mask: int = 0
     recommended_action: Optional[str] = None
     tokens_used: Optional[int] = None
     # Provider metadata
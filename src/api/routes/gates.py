@@ -8,7 +8,6 @@ Security:
 - Rate limited: configurable via settings (default 100/minute for internal service calls)
 """
 
-import asyncio
 import logging
 
 from fastapi import APIRouter, Request
@@ -72,8 +71,8 @@ async def evaluate_gates_batch(
     Evaluate gates for multiple parties at once.
 
     Since gate evaluation is deterministic (no LLM calls), this endpoint
-    efficiently evaluates all parties in parallel and returns which ones
-    are allowed to proceed with draft generation.
+    evaluates all parties in a single synchronous pass and returns which
+    ones are allowed to proceed with draft generation.
 
     This reduces HTTP overhead compared to calling /evaluate-gates N times.
     """
@@ -82,15 +81,19 @@ async def evaluate_gates_batch(
         f"action: {batch_request.proposed_action}"
     )
 
-    # Create individual requests for each context
-    async def evaluate_single(context):
-        single_request = EvaluateGatesRequest(
+    # Create individual requests for each context and evaluate them in one pass
+    single_requests = [
+        EvaluateGatesRequest(
             context=context,
             proposed_action=batch_request.proposed_action,
             proposed_tone=batch_request.proposed_tone,
         )
-        result = await gate_evaluator.evaluate(single_request)
+        for context in batch_request.contexts
+    ]
+    evaluations = gate_evaluator.evaluate_many(single_requests)
 
+    results = []
+    for context, result in zip(batch_request.contexts, evaluations):
         # Find blocking gate if not allowed
         blocking_gate = None
         if not result.allowed:
@@ -99,18 +102,17 @@ async def evaluate_gates_batch(
                     blocking_gate = gate_name
                     break
 
-        return PartyGateResult(
-            party_id=context.party.party_id,
-            customer_code=context.party.customer_code,
-            allowed=result.allowed,
-            gate_results=result.gate_results,
-            recommended_action=result.recommended_action,
-            blocking_gate=blocking_gate,
+        results.append(
+            PartyGateResult(
+                party_id=context.party.party_id,
+                customer_code=context.party.customer_code,
+                allowed=result.allowed,
+                gate_results=result.gate_results,
+                recommended_action=result.recommended_action,
+                blocking_gate=blocking_gate,
+            )
         )
 
-    # Evaluate all parties concurrently
-    results = await asyncio.gather(*[evaluate_single(ctx) for ctx in batch_request.contexts])
-
     allowed_count = sum(1 for r in results if r.allowed)
     blocked_count = len(results) - allowed_count
 
@@ -120,5 +122,5 @@ async def evaluate_gates_batch(
         total=len(results),
         allowed_count=allowed_count,
         blocked_count=blocked_count,
-        results=list(results),
+        results=results,
     )
@@ -63,6 +63,11 @@ class Settings(BaseSettings):
     llm_timeout_seconds: int = 60  # Per-LLM-call timeout (increased for concurrent calls)
     llm_max_retries: int = 3  # Used by tenacity retry decorator
 
+    # LLM response cache (in-memory, keyed by prompt hash)
+    llm_cache_enabled: bool = False
+    llm_cache_max_entries: int = 1024
+    llm_cache_ttl_seconds: int = 3600
+
     # Logging
     log_level: str = "INFO"
 
@@ -9,6 +9,7 @@ HARDSHIP, PLAN_REQUEST, REDIRECT, REQUEST_INFO, OUT_OF_OFFICE, COOPERATIVE, UNCL
 import json
 import logging
 from datetime import date
+from typing import Optional
 
 from pydantic import ValidationError
 
@@ -16,10 +17,11 @@ from src.api.errors import LLMResponseInvalidError
 from src.api.models.requests import ClassifyRequest
 from src.api.models.responses import ClassifyResponse, ExtractedData, GuardrailValidation
 from src.guardrails.base import GuardrailSeverity
-from src.guardrails.pipeline import guardrail_pipeline
-from src.llm.factory import llm_client
+from src.guardrails.pipeline import GuardrailPipeline, guardrail_pipeline
+from src.llm.factory import LLMProviderWithFallback, llm_client
 from src.llm.schemas import ClassificationLLMResponse
 from src.prompts import CLASSIFY_EMAIL_SYSTEM, CLASSIFY_EMAIL_USER
+from src.utils.llm_cache import llm_cache
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +29,21 @@ logger = logging.getLogger(__name__)
 class EmailClassifier:
     """Classifies inbound emails from debtors."""
 
+    def __init__(
+        self,
+        llm: Optional[LLMProviderWithFallback] = None,
+        guardrails: Optional[GuardrailPipeline] = None,
+    ):
+        """
+        Args:
+            llm: LLM client to classify with. Defaults to the shared llm_client;
+                inject a stub in tests instead of patching the module.
+            guardrails: Guardrail pipeline for the output. Defaults to the
+                shared guardrail_pipeline.
+        """
+        self._llm = llm or llm_client
+        self._guardrails = guardrails or guardrail_pipeline
+
     async def classify(self, request: ClassifyRequest) -> ClassifyResponse:
         """
         Classify an inbound email.
@@ -64,29 +81,44 @@ class EmailClassifier:
             body=request.email.body,
         )
 
-        # Call LLM with lower temperature for classification
-        # Use response_schema for guaranteed valid JSON (no markdown wrapping)
-        response = await llm_client.complete(
+        # Identical prompts yield the same classification - reuse a cached result
+        cache_key = llm_cache.make_key(
+            provider=self._llm.primary_provider_name,
             system_prompt=CLASSIFY_EMAIL_SYSTEM,
             user_prompt=user_prompt,
             temperature=0.2,
-            response_schema=ClassificationLLMResponse,
+            schema=ClassificationLLMResponse.__name__,
         )
-
-        # Parse JSON response - structured output guarantees valid JSON
-        tokens_used = response.usage.get("total_tokens", 0)
-        raw_result = json.loads(response.content)
-
-        # Validate LLM response using Pydantic schema
-        try:
-            result = ClassificationLLMResponse(**raw_result)
-        except ValidationError as e:
-            logger.error(f"LLM response validation failed: {e}")
-            raise LLMResponseInvalidError(
-                message="LLM returned invalid classification response",
-                details={"validation_errors": e.errors(), "raw_response": raw_result},
+        cached = llm_cache.get(cache_key)
+        if cached is not None:
+            response, result = cached
+            tokens_used = 0  # No LLM call made
+        else:
+            # Call LLM with lower temperature for classification
+            # Use response_schema for guaranteed valid JSON (no markdown wrapping)
+            response = await self._llm.complete(
+                system_prompt=CLASSIFY_EMAIL_SYSTEM,
+                user_prompt=user_prompt,
+                temperature=0.2,
+                response_schema=ClassificationLLMResponse,
             )
 
+            tokens_used = response.usage.get("total_tokens", 0)
+
+            # Parse and validate in one pass with the schema's compiled validator
+            # (structured output guarantees valid JSON)
+            try:
+                result = ClassificationLLMResponse.model_validate_json(response.content)
+            except ValidationError as e:
+                logger.error(f"LLM response validation failed: {e}")
+                raw_result = json.loads(response.content)
+                raise LLMResponseInvalidError(
+                    message="LLM returned invalid classification response",
+                    details={"validation_errors": e.errors(), "raw_response": raw_result},
+                )
+
+            llm_cache.set(cache_key, (response, result))
+
         # Parse extracted data
         extracted = None
         if result.extracted_data:
@@ -115,7 +147,7 @@ class EmailClassifier:
         # Run guardrails on LLM reasoning (validate any facts mentioned)
         guardrail_validation = None
         if result.reasoning:
-            guardrail_result = guardrail_pipeline.validate(
+            guardrail_result = self._guardrails.validate(
                 output=result.reasoning,
                 context=request.context,
                 extracted_data=extracted,
@@ -162,7 +194,7 @@ class EmailClassifier:
             guardrail_validation=guardrail_validation,
             provider=response.provider,
             model=response.model,
-            is_fallback=(response.provider != llm_client.primary_provider_name),
+            is_fallback=(response.provider != self._llm.primary_provider_name),
         )
 
     def _format_industry_context(self, industry) -> str:
@@ -13,9 +13,10 @@ Gates:
 - escalation_appropriate: Valid escalation path exists
 """
 
+import functools
 import logging
-from datetime import datetime, timezone
-from typing import Optional
+from datetime import date, datetime, timezone
+from typing import Callable, NamedTuple, Optional, Sequence
 
 from src.api.models.requests import EvaluateGatesRequest
 from src.api.models.responses import EvaluateGatesResponse, GateResult
@@ -31,84 +32,180 @@ TONE_ESCALATION_ORDER = [
     "final_notice",
 ]
 
+# Tone -> position in TONE_ESCALATION_ORDER (O(1) lookup instead of list.index)
+TONE_RANK = {tone: rank for rank, tone in enumerate(TONE_ESCALATION_ORDER)}
+
+# Bit per gate in EvaluateGatesResponse.passed_mask (set when the gate passed)
+TOUCH_CAP_BIT = 1 << 0
+COOLING_OFF_BIT = 1 << 1
+DISPUTE_ACTIVE_BIT = 1 << 2
+HARDSHIP_BIT = 1 << 3
+UNSUBSCRIBE_BIT = 1 << 4
+ESCALATION_APPROPRIATE_BIT = 1 << 5
+
+GATE_BITS = {
+    "touch_cap": TOUCH_CAP_BIT,
+    "cooling_off": COOLING_OFF_BIT,
+    "dispute_active": DISPUTE_ACTIVE_BIT,
+    "hardship": HARDSHIP_BIT,
+    "unsubscribe": UNSUBSCRIBE_BIT,
+    "escalation_appropriate": ESCALATION_APPROPRIATE_BIT,
+}
+
+# Failed gate -> recommended action, highest priority first
+RECOMMENDED_ACTIONS = {
+    "unsubscribe": "Remove from contact list - party has opted out",
+    "dispute_active": "Wait for dispute resolution before contact",
+    "cooling_off": "Wait until cooling off period ends",
+    "touch_cap": "Monthly touch limit reached - wait until next month",
+    "escalation_appropriate": "Use less aggressive tone or wait for more touchpoints",
+}
+
+# Cheap blocking gates checked by evaluate(full_report=False), in
+# RECOMMENDED_ACTIONS priority order: the first failure found is then the one
+# a full report would base its recommendation on
+FAST_FAIL_GATES = ("unsubscribe", "dispute_active", "cooling_off", "touch_cap")
+
+# Max memoized gate evaluations per GateEvaluator instance
+GATE_CACHE_SIZE = 1024
+
+
+class GateInputs(NamedTuple):
+    """Plain, hashable inputs to the gate checks (also the memoization key)."""
+
+    monthly_touch_count: int
+    touch_cap: int
+    days_since_last_touch: int
+    touch_interval_days: int
+    do_not_contact_active: bool
+    do_not_contact_until: Optional[date]
+    active_dispute: bool
+    hardship_indicated: bool
+    unsubscribe_requested: bool
+    proposed_tone: Optional[str]
+    last_tone_used: Optional[str]
+    touch_count: int
+    broken_promises_count: int
+    escalation_patience: Optional[str]
+
+
+def _utc_now() -> datetime:
+    """Current time in UTC (default GateEvaluator clock)."""
+    return datetime.now(timezone.utc)
+
 
 class GateEvaluator:
     """Evaluates compliance gates using deterministic rules."""
 
-    async def evaluate(self, request: EvaluateGatesRequest) -> EvaluateGatesResponse:
+    def __init__(self, clock: Optional[Callable[[], datetime]] = None):
+        """
+        Initialize the evaluator.
+
+        Args:
+            clock: Returns the current timezone-aware time. Defaults to UTC now;
+                override for deterministic evaluation (e.g. tests).
+        """
+        self._clock = clock or _utc_now
+        # Gates compiled once into (name, check, blocks) entries, in report order.
+        # Hardship never blocks - it only flags the case for sensitive handling.
+        self._gates = (
+            ("touch_cap", self._evaluate_touch_cap, True),
+            ("cooling_off", self._evaluate_cooling_off, True),
+            ("dispute_active", self._evaluate_dispute, True),
+            ("hardship", self._evaluate_hardship, False),
+            ("unsubscribe", self._evaluate_unsubscribe, True),
+            ("escalation_appropriate", self._evaluate_escalation, True),
+        )
+        self._blocking_gates = frozenset(name for name, _check, blocks in self._gates if blocks)
+        # O(1) boolean/int checks, tried first (in FAST_FAIL_GATES order) when
+        # only `allowed` is needed
+        gates_by_name = {gate[0]: gate for gate in self._gates}
+        self._fast_fail_gates = tuple(gates_by_name[name] for name in FAST_FAIL_GATES)
+        # Gate evaluation is pure given its derived inputs - memoize per instance
+        self._evaluate_gates_cached = functools.lru_cache(maxsize=GATE_CACHE_SIZE)(
+            self._evaluate_gates
+        )
+
+    async def evaluate(
+        self, request: EvaluateGatesRequest, *, full_report: bool = True
+    ) -> EvaluateGatesResponse:
         """
         Evaluate gates for a proposed action using rule-based logic.
 
+        Async wrapper around evaluate_sync for API routes; no I/O is performed.
+
         Args:
             request: Gate evaluation request with context and proposed action
+            full_report: If False, stop at the first failing O(1) blocking gate
+                (see evaluate_sync)
 
         Returns:
             Gate evaluation results with pass/fail for each gate
         """
-        comm = request.context.communication
-        context = request.context
+        return self.evaluate_sync(request, full_report=full_report)
 
-        # Calculate days since last touch
-        days_since_last_touch = 999  # Default to large number if never contacted
-        if comm and comm.last_touch_at:
-            delta = datetime.now(timezone.utc) - comm.last_touch_at
-            days_since_last_touch = delta.days
-
-        # Check do_not_contact_until date
-        do_not_contact_active = False
-        if context.do_not_contact_until:
-            try:
-                hold_date = datetime.fromisoformat(context.do_not_contact_until)
-                if hold_date.tzinfo is None:
-                    hold_date = hold_date.replace(tzinfo=timezone.utc)
-                do_not_contact_active = datetime.now(timezone.utc).date() < hold_date.date()
-            except ValueError:
-                logger.warning(f"Invalid do_not_contact_until date: {context.do_not_contact_until}")
-
-        # Evaluate each gate
-        gate_results = {}
+    def evaluate_many(
+        self, requests: Sequence[EvaluateGatesRequest], *, full_report: bool = True
+    ) -> list[EvaluateGatesResponse]:
+        """
+        Evaluate gates for several requests in one call (e.g. batch endpoint).
 
-        # 1. Touch Cap Gate
-        gate_results["touch_cap"] = self._evaluate_touch_cap(
-            monthly_count=context.monthly_touch_count,
-            cap=context.touch_cap,
-        )
+        Args:
+            requests: Gate evaluation requests, one per party
+            full_report: Passed through to evaluate_sync
 
-        # 2. Cooling Off Gate
-        gate_results["cooling_off"] = self._evaluate_cooling_off(
-            days_since_last=days_since_last_touch,
-            interval_days=context.touch_interval_days,
-            do_not_contact_active=do_not_contact_active,
-            do_not_contact_until=context.do_not_contact_until,
-        )
+        Returns:
+            Gate evaluation results in the same order as requests
+        """
+        evaluate = self.evaluate_sync
+        return [evaluate(request, full_report=full_report) for request in requests]
 
-        # 3. Dispute Active Gate
-        gate_results["dispute_active"] = self._evaluate_dispute(
-            active_dispute=context.active_dispute,
-        )
+    def evaluate_sync(
+        self, request: EvaluateGatesRequest, *, full_report: bool = True
+    ) -> EvaluateGatesResponse:
+        """
+        Evaluate gates for a proposed action using rule-based logic.
 
-        # 4. Hardship Gate
-        gate_results["hardship"] = self._evaluate_hardship(
-            hardship_indicated=context.hardship_indicated,
-        )
+        Args:
+            request: Gate evaluation request with context and proposed action
+            full_report: If False, the cheap blocking gates (unsubscribe,
+                dispute, cooling off, touch cap) are checked first, in
+                recommendation priority, and evaluation stops at the first
+                failure. gate_results then only holds the gates checked so far
+                and passed_mask cannot tell skipped gates from failed ones;
+                recommended_action matches the full report. Use when only
+                `allowed` matters. Allowed results are always full.
 
-        # 5. Unsubscribe Gate
-        gate_results["unsubscribe"] = self._evaluate_unsubscribe(
-            unsubscribe_requested=context.unsubscribe_requested,
-        )
+        Returns:
+            Gate evaluation results with pass/fail for each gate
+        """
+        inputs = self._gate_inputs(request)
+
+        if full_report:
+            # Memoized on the derived inputs; copy so callers can't alter the
+            # cached mapping
+            gate_results = dict(self._evaluate_gates_cached(inputs))
+        else:
+            gate_results = self._evaluate_fast_fail_gates(inputs)
+            if gate_results is None:
+                gate_results = dict(self._evaluate_gates_cached(inputs))
+
+        return self._build_response(request, gate_results)
+
+    def _build_response(
+        self, request: EvaluateGatesRequest, gate_results: dict[str, GateResult]
+    ) -> EvaluateGatesResponse:
+        """Summarize gate results into the API response."""
+        context = request.context
 
-        # 6. Escalation Appropriate Gate
-        gate_results["escalation_appropriate"] = self._evaluate_escalation(
-            proposed_tone=request.proposed_tone,
-            last_tone_used=comm.last_tone_used if comm else None,
-            touch_count=comm.touch_count if comm else 0,
-            broken_promises_count=context.broken_promises_count,
-            case_state=context.case_state,
-            industry=context.industry,
-        )
+        # Overall allowed if all blocking gates pass
+        blocking = self._blocking_gates
+        all_passed = all(g.passed for name, g in gate_results.items() if name in blocking)
 
-        # Overall allowed if all gates pass
-        all_passed = all(g.passed for g in gate_results.values())
+        passed_mask = 0
+        for name, g in gate_results.items():
+            if g.passed:
+                passed_mask |= GATE_BITS[name]
 
         # Generate recommended action if blocked
         recommended_action = None
@@ -124,6 +221,7 @@ class GateEvaluator:
         return EvaluateGatesResponse(
             allowed=all_passed,
             gate_results=gate_results,
+            passed_mask=passed_mask,
             recommended_action=recommended_action,
             tokens_used=0,  # No LLM call
             provider="deterministic",
@@ -131,8 +229,70 @@ class GateEvaluator:
             is_fallback=False,
         )
 
-    def _evaluate_touch_cap(self, monthly_count: int, cap: int) -> GateResult:
+    def _gate_inputs(self, request: EvaluateGatesRequest) -> GateInputs:
+        """
+        Derive the gate inputs for a request.
+
+        Time-dependent values (days since last touch, active hold) are resolved
+        here against the clock, so gate results depend only on the returned
+        tuple and are safe to memoize.
+        """
+        context = request.context
+        comm = context.communication
+        now = self._clock()
+
+        # Calculate days since last touch
+        days_since_last_touch = 999  # Default to large number if never contacted
+        if comm and comm.last_touch_at:
+            delta = now - comm.last_touch_at
+            days_since_last_touch = delta.days
+
+        # Check do_not_contact_until date (parsed by the request model)
+        do_not_contact_active = (
+            context.do_not_contact_until is not None and now.date() < context.do_not_contact_until
+        )
+
+        return GateInputs(
+            monthly_touch_count=context.monthly_touch_count,
+            touch_cap=context.touch_cap,
+            days_since_last_touch=days_since_last_touch,
+            touch_interval_days=context.touch_interval_days,
+            do_not_contact_active=do_not_contact_active,
+            do_not_contact_until=context.do_not_contact_until,
+            active_dispute=context.active_dispute,
+            hardship_indicated=context.hardship_indicated,
+            unsubscribe_requested=context.unsubscribe_requested,
+            proposed_tone=request.proposed_tone,
+            last_tone_used=comm.last_tone_used if comm else None,
+            touch_count=comm.touch_count if comm else 0,
+            broken_promises_count=context.broken_promises_count,
+            escalation_patience=(
+                context.industry.escalation_patience if context.industry else None
+            ),
+        )
+
+    def _evaluate_fast_fail_gates(self, inputs: GateInputs) -> Optional[dict[str, GateResult]]:
+        """
+        Evaluate the O(1) blocking gates, stopping at the first failure.
+
+        Returns:
+            Results for the gates checked up to and including the first failure,
+            or None if all of them pass (the caller then runs the full evaluation)
+        """
+        gate_results = {}
+        for name, check, _blocks in self._fast_fail_gates:
+            result = gate_results[name] = check(inputs)
+            if not result.passed:
+                return gate_results
+        return None
+
+    def _evaluate_gates(self, inputs: GateInputs) -> dict[str, GateResult]:
+        """Evaluate all six gates in order."""
+        return {name: check(inputs) for name, check, _blocks in self._gates}
+
+    def _evaluate_touch_cap(self, inputs: GateInputs) -> GateResult:
         """Check if monthly touch cap has been reached."""
+        monthly_count, cap = inputs.monthly_touch_count, inputs.touch_cap
         passed = monthly_count < cap
         return GateResult(
             passed=passed,
@@ -141,19 +301,16 @@ class GateEvaluator:
             threshold=cap,
         )
 
-    def _evaluate_cooling_off(
-        self,
-        days_since_last: int,
-        interval_days: int,
-        do_not_contact_active: bool,
-        do_not_contact_until: Optional[str],
-    ) -> GateResult:
+    def _evaluate_cooling_off(self, inputs: GateInputs) -> GateResult:
         """Check if cooling off period has elapsed."""
+        days_since_last = inputs.days_since_last_touch
+        interval_days = inputs.touch_interval_days
+
         # Do not contact hold takes precedence
-        if do_not_contact_active:
+        if inputs.do_not_contact_active:
             return GateResult(
                 passed=False,
-                reason=f"Do not contact until {do_not_contact_until}",
+                reason=f"Do not contact until {inputs.do_not_contact_until}",
                 current_value=0,
                 threshold=interval_days,
             )
@@ -166,8 +323,9 @@ class GateEvaluator:
             threshold=interval_days,
         )
 
-    def _evaluate_dispute(self, active_dispute: bool) -> GateResult:
+    def _evaluate_dispute(self, inputs: GateInputs) -> GateResult:
         """Check if there's an active dispute blocking contact."""
+        active_dispute = inputs.active_dispute
         passed = not active_dispute
         return GateResult(
             passed=passed,
@@ -176,8 +334,9 @@ class GateEvaluator:
             threshold=False,
         )
 
-    def _evaluate_hardship(self, hardship_indicated: bool) -> GateResult:
+    def _evaluate_hardship(self, inputs: GateInputs) -> GateResult:
         """Check if hardship has been indicated."""
+        hardship_indicated = inputs.hardship_indicated
         # Hardship doesn't block, but flags for special handling
         # For now, we pass but include warning in reason
         if hardship_indicated:
@@ -194,8 +353,9 @@ class GateEvaluator:
             threshold=None,
         )
 
-    def _evaluate_unsubscribe(self, unsubscribe_requested: bool) -> GateResult:
+    def _evaluate_unsubscribe(self, inputs: GateInputs) -> GateResult:
         """Check if party has requested to unsubscribe."""
+        unsubscribe_requested = inputs.unsubscribe_requested
         passed = not unsubscribe_requested
         return GateResult(
             passed=passed,
@@ -206,15 +366,7 @@ class GateEvaluator:
             threshold=False,
         )
 
-    def _evaluate_escalation(
-        self,
-        proposed_tone: Optional[str],
-        last_tone_used: Optional[str],
-        touch_count: int,
-        broken_promises_count: int,
-        case_state: Optional[str],
-        industry=None,
-    ) -> GateResult:
+    def _evaluate_escalation(self, inputs: GateInputs) -> GateResult:
         """
         Check if proposed escalation is appropriate.
 
@@ -227,11 +379,19 @@ class GateEvaluator:
           - patient: max 1 step (manufacturing, government)
           - standard: max 1 step, or 2 if broken promises
           - aggressive: max 2 steps (retail)
+
+        escalation_patience is None when no industry context was provided.
         """
+        proposed_tone = inputs.proposed_tone
+        last_tone_used = inputs.last_tone_used
+        touch_count = inputs.touch_count
+        broken_promises_count = inputs.broken_promises_count
+        escalation_patience = inputs.escalation_patience
+
         # Get industry escalation patience (affects allowed jump)
-        escalation_patience = "standard"
-        if industry and hasattr(industry, "escalation_patience"):
-            escalation_patience = industry.escalation_patience
+        has_industry = escalation_patience is not None
+        if not has_industry:
+            escalation_patience = "standard"
         if not proposed_tone:
             return GateResult(
                 passed=True,
@@ -243,16 +403,8 @@ class GateEvaluator:
         proposed_tone_lower = proposed_tone.lower()
 
         # Get positions in escalation order
-        proposed_idx = (
-            TONE_ESCALATION_ORDER.index(proposed_tone_lower)
-            if proposed_tone_lower in TONE_ESCALATION_ORDER
-            else -1
-        )
-        last_idx = (
-            TONE_ESCALATION_ORDER.index(last_tone_used.lower())
-            if last_tone_used and last_tone_used.lower() in TONE_ESCALATION_ORDER
-            else -1
-        )
+        proposed_idx = TONE_RANK.get(proposed_tone_lower, -1)
+        last_idx = TONE_RANK.get(last_tone_used.lower(), -1) if last_tone_used else -1
 
         # Unknown tone - allow
         if proposed_idx == -1:
@@ -331,7 +483,7 @@ class GateEvaluator:
             if last_idx + 1 < len(TONE_ESCALATION_ORDER)
             else "N/A"
         )
-        patience_hint = f" (industry patience: {escalation_patience})" if industry else ""
+        patience_hint = f" (industry patience: {escalation_patience})" if has_industry else ""
         return GateResult(
             passed=False,
             reason=f"Escalation from '{last_tone_used}' to '{proposed_tone}' too aggressive (jump of {jump} levels){patience_hint}",
@@ -341,18 +493,10 @@ class GateEvaluator:
 
     def _get_recommended_action(self, gate_results: dict[str, GateResult]) -> str:
         """Generate recommended action based on failed gates."""
-        failed = [k for k, v in gate_results.items() if not v.passed]
-
-        if "unsubscribe" in failed:
-            return "Remove from contact list - party has opted out"
-        if "dispute_active" in failed:
-            return "Wait for dispute resolution before contact"
-        if "cooling_off" in failed:
-            return "Wait until cooling off period ends"
-        if "touch_cap" in failed:
-            return "Monthly touch limit reached - wait until next month"
-        if "escalation_appropriate" in failed:
-            return "Use less aggressive tone or wait for more touchpoints"
+        for gate, action in RECOMMENDED_ACTIONS.items():
+            result = gate_results.get(gate)
+            if result is not None and not result.passed:
+                return action
 
         return "Review gate failures and adjust approach"
 
@@ -12,6 +12,7 @@ to correct its output.
 import json
 import logging
 import time
+from typing import Optional
 
 from pydantic import ValidationError
 
@@ -19,8 +20,8 @@ from src.api.errors import LLMResponseInvalidError
 from src.api.models.requests import GenerateDraftRequest
 from src.api.models.responses import GenerateDraftResponse, GuardrailValidation
 from src.guardrails.base import GuardrailPipelineResult, GuardrailSeverity
-from src.guardrails.pipeline import guardrail_pipeline
-from src.llm.factory import llm_client
+from src.guardrails.pipeline import GuardrailPipeline, guardrail_pipeline
+from src.llm.factory import LLMProviderWithFallback, llm_client
 from src.llm.schemas import DraftGenerationLLMResponse
 from src.prompts import GENERATE_DRAFT_SYSTEM, GENERATE_DRAFT_USER
 
@@ -33,6 +34,21 @@ MAX_GUARDRAIL_RETRIES = 2
 class DraftGenerator:
     """Generates collection email drafts with guardrail retry mechanism."""
 
+    def __init__(
+        self,
+        llm: Optional[LLMProviderWithFallback] = None,
+        guardrails: Optional[GuardrailPipeline] = None,
+    ):
+        """
+        Args:
+            llm: LLM client to generate drafts with. Defaults to the shared llm_client;
+                inject a stub in tests instead of patching the module.
+            guardrails: Guardrail pipeline for the output. Defaults to the
+                shared guardrail_pipeline.
+        """
+        self._llm = llm or llm_client
+        self._guardrails = guardrails or guardrail_pipeline
+
     async def generate(self, request: GenerateDraftRequest) -> GenerateDraftResponse:
         """
         Generate a collection email draft with automatic retry on guardrail failures.
@@ -140,7 +156,7 @@ class DraftGenerator:
             # Call LLM with higher temperature for creative generation
             # Use response_schema for guaranteed valid JSON (no markdown wrapping)
             llm_start = time.perf_counter()
-            response = await llm_client.complete(
+            response = await self._llm.complete(
                 system_prompt=GENERATE_DRAFT_SYSTEM,
                 user_prompt=user_prompt,
                 temperature=0.7,
@@ -151,14 +167,13 @@ class DraftGenerator:
             # Track total tokens across retries
             total_tokens_used += response.usage.get("total_tokens", 0)
 
-            # Parse JSON response - structured output guarantees valid JSON
-            raw_result = json.loads(response.content)
-
-            # Validate LLM response using Pydantic schema
+            # Parse and validate in one pass with the schema's compiled validator
+            # (structured output guarantees valid JSON)
             try:
-                result = DraftGenerationLLMResponse(**raw_result)
+                result = DraftGenerationLLMResponse.model_validate_json(response.content)
             except ValidationError as e:
                 logger.error(f"LLM response validation failed: {e}")
+                raw_result = json.loads(response.content)
                 raise LLMResponseInvalidError(
                     message="LLM returned invalid draft generation response",
                     details={"validation_errors": e.errors(), "raw_response": raw_result},
@@ -166,7 +181,7 @@ class DraftGenerator:
 
             # Run guardrails on generated draft body (critical for factual accuracy)
             guardrail_start = time.perf_counter()
-            guardrail_result = guardrail_pipeline.validate(
+            guardrail_result = self._guardrails.validate(
                 output=result.body,
                 context=request.context,
             )
@@ -254,7 +269,7 @@ class DraftGenerator:
             guardrail_validation=guardrail_validation,
             provider=response.provider,
             model=response.model,
-            is_fallback=(response.provider != llm_client.primary_provider_name),
+            is_fallback=(response.provider != self._llm.primary_provider_name),
         )
 
     def _format_industry_context(self, industry) -> str:
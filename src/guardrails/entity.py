@@ -1,13 +1,13 @@
 """Entity Verification Guardrail - LLM-based validation of customer/party identifiers."""
 
 import asyncio
-import json
 import logging
 import re
 import time
 from typing import Any, List
 
 from pydantic import BaseModel, Field
+from pydantic_core import from_json
 
 from src.api.models.requests import CaseContext
 from src.llm.factory import llm_client
@@ -179,7 +179,8 @@ class EntityVerificationGuardrail(BaseGuardrail):
             raise
 
         # Parse the response - should be clean JSON from structured output
-        result = json.loads(response.content)
+        # with pydantic-core's JSON parser
+        result = from_json(response.content)
 
         results = []
 
@@ -3,12 +3,14 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional, Type
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class LLMResponse(BaseModel):
     """Standardized LLM response across all providers."""
 
+    model_config = ConfigDict(frozen=True)
+
     content: str
     model: str
     provider: str  # "openai", "gemini", etc.
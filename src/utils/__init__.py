@@ -1,6 +1,14 @@
 """Utility modules for solvix-ai."""
 
 from .json_extractor import JSONExtractionError, extract_json
+from .llm_cache import LLMCache, llm_cache
 from .metrics import log_metric, timed_operation
 
-__all__ = ["extract_json", "JSONExtractionError", "timed_operation", "log_metric"]
+__all__ = [
+    "extract_json",
+    "JSONExtractionError",
+    "LLMCache",
+    "llm_cache",
+    "timed_operation",
+    "log_metric",
+]
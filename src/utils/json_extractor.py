@@ -11,6 +11,7 @@ LLMs can return JSON in various formats:
 This module handles all these cases.
 """
 
+import functools
 import json
 import logging
 import re
@@ -18,6 +19,9 @@ from typing import Any, Dict
 
 logger = logging.getLogger(__name__)
 
+# Shared decoder instance (avoids json.loads argument dispatch per attempt)
+_DECODER = json.JSONDecoder()
+
 
 class JSONExtractionError(Exception):
     """Raised when JSON extraction fails after all attempts."""
@@ -28,7 +32,7 @@ class JSONExtractionError(Exception):
         self.attempts = attempts
 
 
-def extract_json(content: str) -> Dict[str, Any]:
+def extract_json(content: str | bytes | bytearray | memoryview) -> Dict[str, Any]:
     """
     Extract JSON from LLM response content.
 
@@ -39,15 +43,29 @@ def extract_json(content: str) -> Dict[str, Any]:
     4. Clean and retry (trailing commas, etc.)
 
     Args:
-        content: Raw LLM response content
+        content: Raw LLM response content. Raw bytes (e.g. an undecoded HTTP
+            body) are accepted and strictly decoded as UTF-8 once up front.
 
     Returns:
         Parsed JSON as dictionary
 
     Raises:
-        JSONExtractionError: If all extraction attempts fail
+        JSONExtractionError: If content is not valid UTF-8 or all extraction
+            attempts fail
     """
-    if not content or not content.strip():
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        raw = bytes(content)
+        try:
+            content = raw.decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise JSONExtractionError(
+                message="LLM response is not valid UTF-8",
+                raw_content=raw.decode("utf-8", errors="replace"),
+                attempts=[f"UTF-8 decode failed: {e}"],
+            ) from e
+
+    # isspace() avoids allocating a stripped copy just to test for emptiness
+    if not content or content.isspace():
         raise JSONExtractionError(
             message="Empty content received from LLM",
             raw_content=content,
@@ -56,50 +74,51 @@ def extract_json(content: str) -> Dict[str, Any]:
 
     attempts = []
 
-    # Strategy 1: Direct parse
-    try:
-        result = json.loads(content)
-        if isinstance(result, dict):
-            return result
-        attempts.append(f"Direct parse returned {type(result).__name__}, not dict")
-    except json.JSONDecodeError as e:
-        attempts.append(f"Direct parse failed: {e}")
+    # Candidates are produced lazily so later strategies only run when needed.
+    # Each entry: (label, debug message on success, candidate producer)
+    stripped = functools.cache(lambda: _strip_markdown_code_blocks(content))
+    strategies = (
+        # Strategy 1: Direct parse
+        ("Direct", None, lambda: content),
+        # Strategy 2: Strip markdown code blocks
+        (
+            "Stripped markdown",
+            "JSON extracted after stripping markdown code blocks",
+            stripped,
+        ),
+        # Strategy 3: Find JSON object in content
+        (
+            "Regex extraction",
+            "JSON extracted using regex object finder",
+            lambda: _find_json_object(content),
+        ),
+        # Strategy 4: Clean content (trailing commas, etc.) and retry
+        (
+            "Cleaned content",
+            "JSON extracted after cleaning content",
+            lambda: _clean_json_content(stripped()),
+        ),
+    )
 
-    # Strategy 2: Strip markdown code blocks
-    stripped = _strip_markdown_code_blocks(content)
-    if stripped != content:
-        try:
-            result = json.loads(stripped)
-            if isinstance(result, dict):
-                logger.debug("JSON extracted after stripping markdown code blocks")
-                return result
-            attempts.append(f"Stripped parse returned {type(result).__name__}, not dict")
-        except json.JSONDecodeError as e:
-            attempts.append(f"Stripped markdown parse failed: {e}")
+    tried: set[str] = set()
+    for label, success_message, produce in strategies:
+        candidate = produce()
+        # Skip empty candidates and inputs an earlier strategy already parsed
+        if not candidate or candidate in tried:
+            continue
+        tried.add(candidate)
 
-    # Strategy 3: Find JSON object in content
-    extracted = _find_json_object(content)
-    if extracted:
         try:
-            result = json.loads(extracted)
-            if isinstance(result, dict):
-                logger.debug("JSON extracted using regex object finder")
-                return result
-            attempts.append(f"Regex extracted parse returned {type(result).__name__}, not dict")
+            result = _DECODER.decode(candidate)
         except json.JSONDecodeError as e:
-            attempts.append(f"Regex extraction parse failed: {e}")
+            attempts.append(f"{label} parse failed: {e}")
+            continue
 
-    # Strategy 4: Clean content (trailing commas, etc.) and retry
-    cleaned = _clean_json_content(stripped if stripped != content else content)
-    if cleaned != content and cleaned != stripped:
-        try:
-            result = json.loads(cleaned)
-            if isinstance(result, dict):
-                logger.debug("JSON extracted after cleaning content")
-                return result
-            attempts.append(f"Cleaned parse returned {type(result).__name__}, not dict")
-        except json.JSONDecodeError as e:
-            attempts.append(f"Cleaned content parse failed: {e}")
+        if isinstance(result, dict):
+            if success_message:
+                logger.debug(success_message)
+            return result
+        attempts.append(f"{label} parse returned {type(result).__name__}, not dict")
 
     # All strategies failed
     logger.error(
@@ -122,7 +141,13 @@ def _strip_markdown_code_blocks(content: str) -> str:
     - ```JSON ... ```
     - ``` ... ```
     - Triple backticks with newlines
+
+    Content without backticks or a leading BOM is returned unchanged.
     """
+    # Fast path: nothing to strip (surrounding whitespace is valid JSON)
+    if "```" not in content and not content.startswith("\ufeff"):
+        return content
+
     # Remove BOM if present
     content = content.lstrip("\ufeff")
 
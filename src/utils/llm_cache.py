@@ -0,0 +1,109 @@
+"""
+In-memory cache for validated LLM responses.
+
+Identical prompts (same case context, same email, same parameters) are sent
+repeatedly, e.g. when Django re-classifies an email after a retry. Caching
+the validated result skips both the LLM round-trip and response
+parsing/validation on a hit.
+
+Only the low-temperature classification call is cached. Draft generation
+runs at a creative temperature and a regenerated draft is expected to
+differ, so it always goes to the LLM.
+
+Keys are a SHA-256 of the prompt inputs, so the full prompt text is never
+kept in memory twice. Entries expire after a TTL and the cache is bounded
+(least recently used entries are evicted first).
+
+Disabled by default - enable with LLM_CACHE_ENABLED=true.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCache:
+    """Thread-safe, size-bounded TTL cache keyed by prompt hash."""
+
+    def __init__(self, enabled: bool = True, max_entries: int = 1024, ttl_seconds: float = 3600):
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """
+        Build a cache key from the inputs that determine an LLM response.
+
+        Args:
+            **parts: Prompt inputs (provider, prompts, temperature, schema name, ...)
+
+        Returns:
+            Hex SHA-256 digest of the canonical JSON encoding of parts
+        """
+        canonical = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if disabled, missing or expired."""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        logger.debug("LLM cache hit: %s", key[:12])
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Singleton instance
+llm_cache = LLMCache(
+    enabled=settings.llm_cache_enabled,
+    max_entries=settings.llm_cache_max_entries,
+    ttl_seconds=settings.llm_cache_ttl_seconds,
+)
@@ -1,6 +1,7 @@
 """Shared test fixtures for Solvix AI Engine tests."""
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+import time
 
 import pytest
 
@@ -16,11 +17,53 @@ from src.api.models.requests import (
     PartyInfo,
     TouchHistory,
 )
+from src.engine.classifier import EmailClassifier
+from src.engine.gate_evaluator import GateEvaluator
+from src.engine.generator import DraftGenerator
+from src.llm.factory import llm_client
+from src.utils.llm_cache import llm_cache
+from tests.helpers import AsyncStub
 
+_real_asyncio_sleep = asyncio.sleep
+_real_time_sleep = time.sleep
 
-@pytest.fixture
+
+@pytest.fixture(autouse=True)
+def _no_sleep(request, monkeypatch):
+    """
+    Skip real delays (e.g. tenacity backoff between LLM retries) in tests.
+
+    Sleeps still yield control (sleep(0)) so event-loop and thread scheduling
+    is unchanged. Mark a test or module with @pytest.mark.real_sleep to opt out.
+    """
+    if request.node.get_closest_marker("real_sleep"):
+        return
+
+    async def _asyncio_sleep(delay, result=None):
+        return await _real_asyncio_sleep(0, result)
+
+    monkeypatch.setattr(asyncio, "sleep", _asyncio_sleep)
+    monkeypatch.setattr(time, "sleep", lambda secs: _real_time_sleep(0))
+
+
+@pytest.fixture(autouse=True)
+def _no_llm_cache(monkeypatch):
+    """
+    Disable and empty the shared LLM response cache for every test.
+
+    The singleton is configured from settings (LLM_CACHE_ENABLED), so without
+    this a cached reply from one test could answer another. Cache tests opt
+    back in with monkeypatch.setattr(llm_cache, "enabled", True).
+    """
+    monkeypatch.setattr(llm_cache, "enabled", False)
+    llm_cache.clear()
+    yield
+    llm_cache.clear()
+
+
+@pytest.fixture(scope="session")
 def sample_email_content() -> EmailContent:
-    """Sample inbound email for classification."""
+    """Sample inbound email for classification (read-only)."""
     return EmailContent(
         subject="Re: Invoice #12345",
         body="I cannot pay right now. I lost my job last month. Can we work out a payment plan?",
@@ -29,7 +72,7 @@ def sample_email_content() -> EmailContent:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_party_info() -> PartyInfo:
     """Sample party/customer info."""
     return PartyInfo(
@@ -41,7 +84,7 @@ def sample_party_info() -> PartyInfo:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_behavior_info() -> BehaviorInfo:
     """Sample payment behavior metrics."""
     return BehaviorInfo(
@@ -52,7 +95,7 @@ def sample_behavior_info() -> BehaviorInfo:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_obligations() -> list[ObligationInfo]:
     """Sample outstanding invoices."""
     return [
@@ -75,7 +118,7 @@ def sample_obligations() -> list[ObligationInfo]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_communication_info() -> CommunicationInfo:
     """Sample communication history summary."""
     return CommunicationInfo(
@@ -87,14 +130,14 @@ def sample_communication_info() -> CommunicationInfo:
     )
 
 
-@pytest.fixture
-def sample_case_context(
+@pytest.fixture(scope="session")
+def sample_case_context_payload(
     sample_party_info,
     sample_behavior_info,
     sample_obligations,
     sample_communication_info,
-) -> CaseContext:
-    """Complete case context for AI operations."""
+) -> dict:
+    """Validated case context, dumped once per session."""
     return CaseContext(
         party=sample_party_info,
         behavior=sample_behavior_info,
@@ -116,21 +159,59 @@ def sample_case_context(
         brand_tone="professional",
         touch_cap=10,
         touch_interval_days=3,
+    ).model_dump()
+
+
+@pytest.fixture(scope="session")
+def minimal_case_context() -> CaseContext:
+    """Smallest valid case context (one party, one invoice) - read-only."""
+    return CaseContext(
+        party=PartyInfo(party_id="p1", customer_code="C1", name="Test Corp"),
+        obligations=[
+            ObligationInfo(
+                invoice_number="INV-1",
+                original_amount=100,
+                amount_due=100,
+                due_date="2024-01-01",
+                days_past_due=30,
+            )
+        ],
     )
 
 
+@pytest.fixture
+def sample_case_context(sample_case_context_payload) -> CaseContext:
+    """Complete case context for AI operations (fresh per test, safe to mutate).
+
+    Re-validating the cached payload builds new nested models and is cheaper
+    than constructing them from scratch or deep-copying a shared instance.
+    """
+    return CaseContext.model_validate(sample_case_context_payload)
+
+
 @pytest.fixture
 def sample_classify_request(sample_email_content, sample_case_context) -> ClassifyRequest:
-    """Complete classification request."""
+    """Complete classification request (fresh per test, safe to mutate)."""
     return ClassifyRequest(
-        email=sample_email_content,
+        email=sample_email_content.model_copy(),
         context=sample_case_context,
     )
 
 
+@pytest.fixture(scope="session")
+def sample_classify_request_ro(
+    sample_email_content, sample_case_context_payload
+) -> ClassifyRequest:
+    """Classification request shared across the session - never mutate it."""
+    return ClassifyRequest(
+        email=sample_email_content,
+        context=CaseContext.model_validate(sample_case_context_payload),
+    )
+
+
 @pytest.fixture
 def sample_generate_draft_request(sample_case_context) -> GenerateDraftRequest:
-    """Complete draft generation request."""
+    """Complete draft generation request (fresh per test, safe to mutate)."""
     return GenerateDraftRequest(
         context=sample_case_context,
         tone="concerned_inquiry",
@@ -138,20 +219,70 @@ def sample_generate_draft_request(sample_case_context) -> GenerateDraftRequest:
     )
 
 
+@pytest.fixture(scope="session")
+def sample_generate_draft_request_ro(sample_case_context_payload) -> GenerateDraftRequest:
+    """Draft generation request shared across the session - never mutate it.
+
+    Derive per-test variants with model_copy(update=...).
+    """
+    return GenerateDraftRequest(
+        context=CaseContext.model_validate(sample_case_context_payload),
+        tone="concerned_inquiry",
+        objective="follow_up",
+    )
+
+
 @pytest.fixture
 def sample_evaluate_gates_request(sample_case_context) -> EvaluateGatesRequest:
-    """Complete gate evaluation request."""
+    """Complete gate evaluation request (fresh per test, safe to mutate)."""
     return EvaluateGatesRequest(
         context=sample_case_context,
         proposed_action="send_email",
     )
 
 
+@pytest.fixture(scope="session")
+def sample_evaluate_gates_request_ro(sample_case_context_payload) -> EvaluateGatesRequest:
+    """Gate evaluation request shared across the session - never mutate it.
+
+    Derive per-test variants with model_copy(update=...), which copies only
+    the models being changed.
+    """
+    return EvaluateGatesRequest(
+        context=CaseContext.model_validate(sample_case_context_payload),
+        proposed_action="send_email",
+    )
+
+
+# Engine instances hold no per-request state (LLM calls are patched per test
+# on the module-level client), so one instance is shared across the run.
+
+
+@pytest.fixture(scope="session")
+def classifier() -> EmailClassifier:
+    """Shared EmailClassifier instance."""
+    return EmailClassifier()
+
+
+@pytest.fixture(scope="session")
+def generator() -> DraftGenerator:
+    """Shared DraftGenerator instance."""
+    return DraftGenerator()
+
+
+@pytest.fixture(scope="session")
+def gate_evaluator() -> GateEvaluator:
+    """Shared GateEvaluator instance (real clock)."""
+    return GateEvaluator()
+
+
 @pytest.fixture
-def mock_openai_client():
-    """Mock OpenAI client for testing."""
-    mock = MagicMock()
-    mock.chat = MagicMock()
-    mock.chat.completions = MagicMock()
-    mock.chat.completions.create = AsyncMock()
-    return mock
+def mock_llm_complete(monkeypatch):
+    """Replace the shared llm_client.complete with an AsyncStub for one test.
+
+    monkeypatch.setattr is a plain attribute swap, restored at teardown,
+    without mock.patch's target resolution on every entry/exit.
+    """
+    stub = AsyncStub()
+    monkeypatch.setattr(llm_client, "complete", stub)
+    return stub
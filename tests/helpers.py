@@ -0,0 +1,111 @@
+"""Plain test helpers (stubs, canned LLM replies) shared across test modules.
+
+Fixtures live in conftest.py; anything a test module imports directly
+belongs here.
+"""
+
+import json
+from types import SimpleNamespace
+from typing import NamedTuple
+
+from src.llm.base import LLMResponse
+
+# Canned classifier LLM replies keyed by classification, JSON-encoded once
+CLASSIFICATION_RESPONSES: dict[str, str] = {
+    classification: json.dumps(payload)
+    for classification, payload in {
+        "HARDSHIP": {
+            "classification": "HARDSHIP",
+            "confidence": 0.92,
+            "reasoning": "Customer mentions job loss and requests payment plan",
+            "extracted_data": {
+                "promise_date": None,
+                "promise_amount": None,
+                "dispute_type": None,
+                "dispute_reason": None,
+                "redirect_contact": None,
+                "redirect_email": None,
+            },
+        },
+        "PROMISE_TO_PAY": {
+            "classification": "PROMISE_TO_PAY",
+            "confidence": 0.95,
+            "reasoning": "Customer commits to specific payment amount and date",
+            "extracted_data": {"promise_amount": 1500, "promise_date": "2024-01-20"},
+        },
+        "DISPUTE": {
+            "classification": "DISPUTE",
+            "confidence": 0.88,
+            "reasoning": "Customer claims goods not received and disputes charge",
+            "extracted_data": {"dispute_reason": "goods_not_received"},
+        },
+        "UNSUBSCRIBE": {
+            "classification": "UNSUBSCRIBE",
+            "confidence": 0.97,
+            "reasoning": "Customer explicitly requests removal from mailing list",
+            "extracted_data": None,
+        },
+        "OUT_OF_OFFICE": {
+            "classification": "OUT_OF_OFFICE",
+            "confidence": 0.99,
+            "reasoning": "Automatic out of office reply detected",
+            "extracted_data": None,
+        },
+    }.items()
+}
+
+
+class AsyncStub:
+    """
+    Minimal stand-in for AsyncMock when a test only needs a canned return value.
+
+    Records the last call's arguments and the number of awaits, without
+    AsyncMock's call-recording machinery.
+    """
+
+    def __init__(self, return_value=None):
+        self.return_value = return_value
+        self.call_args = None
+        self.await_count = 0
+
+    async def __call__(self, *args, **kwargs):
+        self.call_args = SimpleNamespace(args=args, kwargs=kwargs)
+        self.await_count += 1
+        return self.return_value
+
+
+def make_llm_response(
+    content: dict | str,
+    tokens: int = 100,
+    *,
+    model: str = "test-model",
+    provider: str = "test",
+    usage: dict | None = None,
+) -> LLMResponse:
+    """Build an LLMResponse for a mocked llm_client.complete (dicts are JSON-encoded).
+
+    LLMResponse is frozen, so test modules build their canned replies once as
+    module constants and share them across tests.
+
+    The fields are known-valid test data, so model_construct skips validation.
+    """
+    return LLMResponse.model_construct(
+        content=content if isinstance(content, str) else json.dumps(content),
+        model=model,
+        provider=provider,
+        usage=usage if usage is not None else {"total_tokens": tokens},
+    )
+
+
+class StubGuardrailResult(NamedTuple):
+    """The GuardrailPipelineResult fields the engines read."""
+
+    all_passed: bool
+    results: tuple
+    blocking_guardrails: tuple
+
+
+# Guardrail pipeline stand-in that passes every output (the engines only
+# read the result, so one instance is returned for every call)
+PASSING_GUARDRAIL_RESULT = StubGuardrailResult(all_passed=True, results=(), blocking_guardrails=())
+PASSING_GUARDRAILS = SimpleNamespace(validate=lambda *args, **kwargs: PASSING_GUARDRAIL_RESULT)
@@ -1,16 +1,22 @@
 """API integration tests for Solvix AI Engine."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
 
+from src.api.models.responses import (
+    ClassifyResponse,
+    EvaluateGatesResponse,
+    GenerateDraftResponse,
+)
 from src.main import app
+from tests.helpers import AsyncStub
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Create test client."""
+    """Create test client (shared; routes are patched per test)."""
     return TestClient(app)
 
 
@@ -60,17 +66,15 @@ class TestClassifyEndpoint:
         assert response.status_code == 422
 
     @patch("src.api.routes.classify.classifier")
-    def test_classify_success(self, mock_classifier, client, sample_classify_request):
+    def test_classify_success(self, mock_classifier, client, sample_classify_request_ro):
         """Test successful classification."""
-        from src.api.models.responses import ClassifyResponse
-
         mock_response = ClassifyResponse(
             classification="HARDSHIP", confidence=0.92, reasoning="Job loss mentioned"
         )
-        # Use AsyncMock for the async classify method
-        mock_classifier.classify = AsyncMock(return_value=mock_response)
+        # Use AsyncStub for the async classify method
+        mock_classifier.classify = AsyncStub(mock_response)
 
-        response = client.post("/classify", json=sample_classify_request.model_dump(mode="json"))
+        response = client.post("/classify", json=sample_classify_request_ro.model_dump(mode="json"))
 
         assert response.status_code == 200
         data = response.json()
@@ -87,21 +91,19 @@ class TestGenerateEndpoint:
         assert response.status_code == 422
 
     @patch("src.api.routes.generate.generator")
-    def test_generate_success(self, mock_generator, client, sample_generate_draft_request):
+    def test_generate_success(self, mock_generator, client, sample_generate_draft_request_ro):
         """Test successful draft generation."""
-        from src.api.models.responses import GenerateDraftResponse
-
         mock_response = GenerateDraftResponse(
             subject="Re: Your Account",
             body="Dear Customer,\n\nThank you for reaching out.",
             tone_used="concerned_inquiry",
             invoices_referenced=["INV-123"],
         )
-        # Use AsyncMock for the async generate method
-        mock_generator.generate = AsyncMock(return_value=mock_response)
+        # Use AsyncStub for the async generate method
+        mock_generator.generate = AsyncStub(mock_response)
 
         response = client.post(
-            "/generate-draft", json=sample_generate_draft_request.model_dump(mode="json")
+            "/generate-draft", json=sample_generate_draft_request_ro.model_dump(mode="json")
         )
 
         assert response.status_code == 200
@@ -120,20 +122,41 @@ class TestGatesEndpoint:
         assert response.status_code == 422
 
     @patch("src.api.routes.gates.gate_evaluator")
-    def test_gates_success(self, mock_evaluator, client, sample_evaluate_gates_request):
+    def test_gates_success(self, mock_evaluator, client, sample_evaluate_gates_request_ro):
         """Test successful gate evaluation."""
-        from src.api.models.responses import EvaluateGatesResponse
-
         mock_response = EvaluateGatesResponse(
             allowed=True, gate_results={}, recommended_action=None
         )
-        # Use AsyncMock for the async evaluate method
-        mock_evaluator.evaluate = AsyncMock(return_value=mock_response)
+        # Use AsyncStub for the async evaluate method
+        mock_evaluator.evaluate = AsyncStub(mock_response)
 
         response = client.post(
-            "/evaluate-gates", json=sample_evaluate_gates_request.model_dump(mode="json")
+            "/evaluate-gates", json=sample_evaluate_gates_request_ro.model_dump(mode="json")
         )
 
         assert response.status_code == 200
         data = response.json()
         assert data["allowed"] is True
+
+    @pytest.mark.parametrize(
+        "hold_until,cooling_off_passed",
+        [
+            ("", True),  # empty: ignored
+            ("garbage", True),  # malformed: logged and ignored
+            ("2099-01-01T10:00:00+00:00", False),  # datetime: cut to its date
+        ],
+        ids=["empty", "malformed", "datetime"],
+    )
+    def test_gates_tolerates_do_not_contact_until(
+        self, client, sample_evaluate_gates_request_ro, hold_until, cooling_off_passed
+    ):
+        """Bad or datetime-shaped hold dates never fail the request."""
+        payload = sample_evaluate_gates_request_ro.model_dump(mode="json")
+        payload["context"]["do_not_contact_until"] = hold_until
+        payload["context"]["party"]["do_not_contact_until"] = hold_until
+
+        response = client.post("/evaluate-gates", json=payload)
+
+        assert response.status_code == 200
+        cooling_off = response.json()["gate_results"]["cooling_off"]
+        assert cooling_off["passed"] is cooling_off_passed
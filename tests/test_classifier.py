@@ -1,190 +1,96 @@
 """Unit tests for EmailClassifier."""
 
 import json
-from unittest.mock import AsyncMock, patch
+from datetime import date
 
 import pytest
 
 from src.api.errors import LLMResponseInvalidError
-from src.api.models.responses import ClassifyResponse
-from src.engine.classifier import EmailClassifier
-from src.llm.base import LLMResponse
-
-
-def _make_llm_response(content: dict, tokens: int = 100) -> LLMResponse:
-    """Helper to create mock LLMResponse objects."""
-    return LLMResponse(
-        content=json.dumps(content),
-        model="test-model",
-        provider="test",
-        usage={"total_tokens": tokens},
-    )
+from tests.helpers import CLASSIFICATION_RESPONSES, make_llm_response
+
+# (id, classification, email body - None keeps the fixture's hardship email,
+#  expected extracted_data fields)
+CLASSIFY_CASES = [
+    ("hardship", "HARDSHIP", None, {}),
+    (
+        "promise_to_pay",
+        "PROMISE_TO_PAY",
+        "I will pay the full amount of £1500 by Friday January 20th.",
+        {"promise_amount": 1500, "promise_date": date(2024, 1, 20)},
+    ),
+    (
+        "dispute",
+        "DISPUTE",
+        "I never received the goods for invoice #12345. This charge is incorrect.",
+        {"dispute_reason": "goods_not_received"},
+    ),
+    (
+        "unsubscribe",
+        "UNSUBSCRIBE",
+        "Please remove me from your mailing list. I do not wish to receive further emails.",
+        {},
+    ),
+    (
+        "out_of_office",
+        "OUT_OF_OFFICE",
+        "I am currently out of the office with no access to email. I will return on January 25th.",
+        {},
+    ),
+]
+
+CLASSIFY_LLM_RESPONSES = {
+    classification: make_llm_response(reply)
+    for classification, reply in CLASSIFICATION_RESPONSES.items()
+}
+EMPTY_LLM_RESPONSE = make_llm_response("{}")
 
 
 class TestEmailClassifier:
     """Tests for EmailClassifier."""
 
-    @pytest.fixture
-    def classifier(self):
-        """Create classifier instance."""
-        return EmailClassifier()
-
-    @pytest.mark.asyncio
-    async def test_classify_hardship_email(self, classifier, sample_classify_request):
-        """Test classification of hardship email."""
-        mock_response = _make_llm_response(
-            {
-                "classification": "HARDSHIP",
-                "confidence": 0.92,
-                "reasoning": "Customer mentions job loss and requests payment plan",
-                "extracted_data": {
-                    "promise_date": None,
-                    "promise_amount": None,
-                    "dispute_type": None,
-                    "dispute_reason": None,
-                    "redirect_contact": None,
-                    "redirect_email": None,
-                },
-            }
-        )
-
-        with patch(
-            "src.engine.classifier.llm_client.complete", new_callable=AsyncMock
-        ) as mock_complete:
-            mock_complete.return_value = mock_response
-
-            result = await classifier.classify(sample_classify_request)
-
-            assert isinstance(result, ClassifyResponse)
-            assert result.classification == "HARDSHIP"
-            assert result.confidence >= 0.9
-            assert "job" in result.reasoning.lower() or "hardship" in result.reasoning.lower()
-
-    @pytest.mark.asyncio
-    async def test_classify_promise_to_pay(self, classifier, sample_classify_request):
-        """Test classification of promise to pay email."""
-        from datetime import date
-
-        sample_classify_request.email.body = (
-            "I will pay the full amount of £1500 by Friday January 20th."
-        )
-
-        mock_response = _make_llm_response(
-            {
-                "classification": "PROMISE_TO_PAY",
-                "confidence": 0.95,
-                "reasoning": "Customer commits to specific payment amount and date",
-                "extracted_data": {"promise_amount": 1500, "promise_date": "2024-01-20"},
-            }
-        )
-
-        with patch(
-            "src.engine.classifier.llm_client.complete", new_callable=AsyncMock
-        ) as mock_complete:
-            mock_complete.return_value = mock_response
-
-            result = await classifier.classify(sample_classify_request)
-
-            assert result.classification == "PROMISE_TO_PAY"
-            assert result.extracted_data is not None
-            assert result.extracted_data.promise_amount == 1500
-            assert result.extracted_data.promise_date == date(2024, 1, 20)
-
-    @pytest.mark.asyncio
-    async def test_classify_dispute_email(self, classifier, sample_classify_request):
-        """Test classification of dispute email."""
-        sample_classify_request.email.body = (
-            "I never received the goods for invoice #12345. This charge is incorrect."
-        )
-
-        mock_response = _make_llm_response(
-            {
-                "classification": "DISPUTE",
-                "confidence": 0.88,
-                "reasoning": "Customer claims goods not received and disputes charge",
-                "extracted_data": {"dispute_reason": "goods_not_received"},
-            }
-        )
-
-        with patch(
-            "src.engine.classifier.llm_client.complete", new_callable=AsyncMock
-        ) as mock_complete:
-            mock_complete.return_value = mock_response
-
-            result = await classifier.classify(sample_classify_request)
-
-            assert result.classification == "DISPUTE"
-            assert result.extracted_data.dispute_reason == "goods_not_received"
-
     @pytest.mark.asyncio
-    async def test_classify_unsubscribe_email(self, classifier, sample_classify_request):
-        """Test classification of unsubscribe request."""
-        sample_classify_request.email.body = (
-            "Please remove me from your mailing list. I do not wish to receive further emails."
-        )
-
-        mock_response = _make_llm_response(
-            {
-                "classification": "UNSUBSCRIBE",
-                "confidence": 0.97,
-                "reasoning": "Customer explicitly requests removal from mailing list",
-                "extracted_data": None,
-            }
-        )
-
-        with patch(
-            "src.engine.classifier.llm_client.complete", new_callable=AsyncMock
-        ) as mock_complete:
-            mock_complete.return_value = mock_response
-
-            result = await classifier.classify(sample_classify_request)
-
-            assert result.classification == "UNSUBSCRIBE"
-            assert result.confidence > 0.9
+    @pytest.mark.parametrize(
+        "classification,email_body,expected_extracted",
+        [case[1:] for case in CLASSIFY_CASES],
+        ids=[case[0] for case in CLASSIFY_CASES],
+    )
+    async def test_classify(
+        self,
+        classifier,
+        sample_classify_request_ro,
+        mock_llm_complete,
+        classification,
+        email_body,
+        expected_extracted,
+    ):
+        """Test each category's LLM reply maps onto the response, incl. extracted data."""
+        request = sample_classify_request_ro
+        if email_body is not None:
+            email = request.email.model_copy(update={"body": email_body})
+            request = request.model_copy(update={"email": email})
+        reply = CLASSIFICATION_RESPONSES[classification]
+        mock_llm_complete.return_value = CLASSIFY_LLM_RESPONSES[classification]
+
+        result = await classifier.classify(request)
+
+        expected = json.loads(reply)
+        assert result.classification == classification
+        assert result.confidence == expected["confidence"]
+        assert result.reasoning == expected["reasoning"]
+        for field, value in expected_extracted.items():
+            assert getattr(result.extracted_data, field) == value
 
     @pytest.mark.asyncio
-    async def test_classify_handles_invalid_response(self, classifier, sample_classify_request):
+    async def test_classify_handles_invalid_response(
+        self, classifier, sample_classify_request_ro, mock_llm_complete
+    ):
         """Test classifier handles malformed LLM response with structured error."""
         # Response missing required fields
-        mock_response = LLMResponse(
-            content="{}",
-            model="test-model",
-            provider="test",
-            usage={"total_tokens": 100},
-        )
-
-        with patch(
-            "src.engine.classifier.llm_client.complete", new_callable=AsyncMock
-        ) as mock_complete:
-            mock_complete.return_value = mock_response
-
-            with pytest.raises(LLMResponseInvalidError) as exc_info:
-                await classifier.classify(sample_classify_request)
-
-            # Verify the error has proper structure
-            assert exc_info.value.error_code.value == "LLM_RESPONSE_INVALID"
-            assert exc_info.value.details is not None
-
-    @pytest.mark.asyncio
-    async def test_classify_out_of_office(self, classifier, sample_classify_request):
-        """Test classification of out of office auto-reply."""
-        sample_classify_request.email.body = "I am currently out of the office with no access to email. I will return on January 25th."
-        sample_classify_request.email.subject = "Out of Office: Re: Invoice #12345"
-
-        mock_response = _make_llm_response(
-            {
-                "classification": "OUT_OF_OFFICE",
-                "confidence": 0.99,
-                "reasoning": "Automatic out of office reply detected",
-                "extracted_data": None,
-            }
-        )
-
-        with patch(
-            "src.engine.classifier.llm_client.complete", new_callable=AsyncMock
-        ) as mock_complete:
-            mock_complete.return_value = mock_response
+        mock_llm_complete.return_value = EMPTY_LLM_RESPONSE
 
-            result = await classifier.classify(sample_classify_request)
+        with pytest.raises(LLMResponseInvalidError) as exc_info:
+            await classifier.classify(sample_classify_request_ro)
 
-            assert result.classification == "OUT_OF_OFFICE"
+        # Verify the error has proper structure
+        assert exc_info.value.error_code.value == "LLM_RESPONSE_INVALID"
+        assert exc_info.value.details is not None
@@ -1,419 +1,437 @@
 """Unit tests for GateEvaluator (deterministic rule-based logic).
 
-27 scenarios covering all 6 gates:
-- Touch Cap (4 tests)
-- Cooling Off (5 tests)
-- Dispute (2 tests)
-- Hardship (2 tests)
-- Unsubscribe (2 tests)
-- Escalation Appropriate (9 tests)
-- Combined Scenarios (3 tests)
+Tests call the synchronous evaluate_sync core directly - evaluation does no
+I/O, so no event loop is needed.
+
+Scenarios covering all 6 gates (single-gate groups are parametrized):
+- Touch Cap (4 cases)
+- Cooling Off (5 cases)
+- Dispute (2 cases)
+- Hardship (2 cases)
+- Unsubscribe (2 cases)
+- Escalation Appropriate (9 cases)
+- Combined Scenarios, incl. batch (4 tests)
+- Memoization (2 tests)
+- Fast Path (7 cases)
 """
 
 from datetime import datetime, timedelta, timezone
 
 import pytest
 
-from src.api.models.responses import EvaluateGatesResponse
-from src.engine.gate_evaluator import GateEvaluator
+from src.api.models.requests import IndustryInfo
+from src.engine.gate_evaluator import (
+    COOLING_OFF_BIT,
+    DISPUTE_ACTIVE_BIT,
+    TOUCH_CAP_BIT,
+    UNSUBSCRIBE_BIT,
+    GateEvaluator,
+)
+
+# Frozen evaluation time - keeps day-boundary arithmetic deterministic
+NOW = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+# Industry contexts for escalation cases, keyed by escalation_patience
+INDUSTRY_RETAIL_AGGRESSIVE = IndustryInfo(
+    code="retail",
+    name="Retail",
+    typical_dso_days=30,
+    alarm_dso_days=45,
+    payment_cycle="net30",
+    escalation_patience="aggressive",
+)
+INDUSTRY_MFG_PATIENT = IndustryInfo(
+    code="manufacturing",
+    name="Manufacturing",
+    typical_dso_days=60,
+    alarm_dso_days=90,
+    payment_cycle="net60",
+    escalation_patience="patient",
+)
+INDUSTRIES = {
+    None: None,
+    "aggressive": INDUSTRY_RETAIL_AGGRESSIVE,
+    "patient": INDUSTRY_MFG_PATIENT,
+}
+
+# Escalation spec. Tone order: friendly(0), professional(1), concerned(2), firm(3), final(4).
+# Max jump: patient=1, standard=1 (2 with broken promises), aggressive=2.
+# (id, touch_count, last_tone, proposed_tone, escalation_patience, broken_promises, passed)
+ESCALATION_CASES = [
+    ("first_contact_friendly", 0, None, "friendly_reminder", None, 0, True),
+    ("first_contact_firm_fails", 0, None, "firm", None, 0, False),
+    ("first_contact_final_notice_fails", 0, None, "final_notice", None, 0, False),
+    ("single_step_standard", 3, "professional", "concerned_inquiry", None, 0, True),
+    ("double_step_standard_no_broken_promises_fails", 3, "professional", "firm", None, 0, False),
+    ("double_step_standard_broken_promises", 3, "professional", "firm", None, 2, True),
+    ("double_step_aggressive_industry", 3, "professional", "firm", "aggressive", 0, True),
+    ("single_step_patient_industry", 5, "firm", "final_notice", "patient", 1, True),
+    ("de_escalation_allowed", 3, "firm", "friendly_reminder", None, 0, True),
+]
+
+# passed_mask with every gate bit set
+FULL_PASS_MASK = 0b111111
+
+
+def assert_all_gates_pass(result):
+    """Assert every gate passed, in one comparison against FULL_PASS_MASK."""
+    assert result.passed_mask == FULL_PASS_MASK, f"passed_mask={result.passed_mask:06b}"
+
+
+def _with(request, *, proposed_tone=None, communication=None, **context_overrides):
+    """
+    Copy a gate request with overrides, in one model_copy per level.
+
+    Args:
+        request: Base EvaluateGatesRequest (left unchanged)
+        proposed_tone: Replacement proposed_tone, if given
+        communication: CommunicationInfo field overrides, if given
+        **context_overrides: CaseContext field overrides
+    """
+    context = request.context
+    if communication:
+        context_overrides["communication"] = context.communication.model_copy(update=communication)
+    update = {"context": context.model_copy(update=context_overrides)}
+    if proposed_tone is not None:
+        update["proposed_tone"] = proposed_tone
+    return request.model_copy(update=update)
+
+
+@pytest.fixture(scope="module")
+def evaluator():
+    """Create evaluator instance (stateless, shared across tests) with a frozen clock."""
+    return GateEvaluator(clock=lambda: NOW)
 
 
 class TestGateEvaluator:
     """Tests for GateEvaluator deterministic evaluation."""
 
-    @pytest.fixture
-    def evaluator(self):
-        """Create evaluator instance."""
-        return GateEvaluator()
-
     # =========================================================================
-    # Touch Cap Gate (4 tests)
+    # Touch Cap Gate (4 cases)
     # =========================================================================
 
-    @pytest.mark.asyncio
-    async def test_touch_cap_zero_count(self, evaluator, sample_evaluate_gates_request):
-        """Test touch cap passes with zero touches."""
-        sample_evaluate_gates_request.context.monthly_touch_count = 0
-        sample_evaluate_gates_request.context.touch_cap = 10
-
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
-
-        assert result.gate_results["touch_cap"].passed is True
-
-    @pytest.mark.asyncio
-    async def test_touch_cap_just_under(self, evaluator, sample_evaluate_gates_request):
-        """Test touch cap passes when just under limit."""
-        sample_evaluate_gates_request.context.monthly_touch_count = 9
-        sample_evaluate_gates_request.context.touch_cap = 10
-
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
-
-        assert result.gate_results["touch_cap"].passed is True
-
-    @pytest.mark.asyncio
-    async def test_touch_cap_at_limit(self, evaluator, sample_evaluate_gates_request):
-        """Test touch cap fails when at limit."""
-        sample_evaluate_gates_request.context.monthly_touch_count = 10
-        sample_evaluate_gates_request.context.touch_cap = 10
-
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
-
-        assert result.gate_results["touch_cap"].passed is False
-        assert result.allowed is False
-
-    @pytest.mark.asyncio
-    async def test_touch_cap_over_limit(self, evaluator, sample_evaluate_gates_request):
-        """Test touch cap fails when over limit."""
-        sample_evaluate_gates_request.context.monthly_touch_count = 15
-        sample_evaluate_gates_request.context.touch_cap = 10
+    @pytest.mark.parametrize(
+        "monthly_touch_count,expected_passed",
+        [(0, True), (9, True), (10, False), (15, False)],
+        ids=["zero_count", "just_under", "at_limit", "over_limit"],
+    )
+    def test_touch_cap(
+        self, evaluator, sample_evaluate_gates_request_ro, monthly_touch_count, expected_passed
+    ):
+        """Test touch cap passes below the cap (10) and blocks at or above it."""
+        request = _with(
+            sample_evaluate_gates_request_ro, monthly_touch_count=monthly_touch_count, touch_cap=10
+        )
 
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
+        result = evaluator.evaluate_sync(request)
 
-        assert result.gate_results["touch_cap"].passed is False
-        assert result.allowed is False
+        assert result.gate_results["touch_cap"].passed is expected_passed
+        if not expected_passed:
+            assert result.allowed is False
 
     # =========================================================================
-    # Cooling Off Gate (5 tests)
+    # Cooling Off Gate (5 cases)
     # =========================================================================
 
-    @pytest.mark.asyncio
-    async def test_cooling_off_no_last_touch(self, evaluator, sample_evaluate_gates_request):
-        """Test cooling off passes on first contact (no last_touch_at)."""
-        sample_evaluate_gates_request.context.communication.last_touch_at = None
-        sample_evaluate_gates_request.context.touch_interval_days = 3
-
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
-
-        assert result.gate_results["cooling_off"].passed is True
-
-    @pytest.mark.asyncio
-    async def test_cooling_off_sufficient_gap(self, evaluator, sample_evaluate_gates_request):
-        """Test cooling off passes with sufficient gap (5 days > 3 interval)."""
-        sample_evaluate_gates_request.context.communication.last_touch_at = datetime.now(
-            timezone.utc
-        ) - timedelta(days=5)
-        sample_evaluate_gates_request.context.touch_interval_days = 3
-
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
-
-        assert result.gate_results["cooling_off"].passed is True
-
-    @pytest.mark.asyncio
-    async def test_cooling_off_insufficient_gap(self, evaluator, sample_evaluate_gates_request):
-        """Test cooling off fails with insufficient gap (1 day < 3 interval)."""
-        sample_evaluate_gates_request.context.communication.last_touch_at = datetime.now(
-            timezone.utc
-        ) - timedelta(days=1)
-        sample_evaluate_gates_request.context.touch_interval_days = 3
-
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
-
-        assert result.gate_results["cooling_off"].passed is False
-
-    @pytest.mark.asyncio
-    async def test_cooling_off_do_not_contact_future(
-        self, evaluator, sample_evaluate_gates_request
+    @pytest.mark.parametrize(
+        "last_touch_days_ago,do_not_contact_days,expected_passed",
+        [
+            (None, None, True),  # First contact (no last_touch_at)
+            (5, None, True),  # 5 days > 3 interval
+            (1, None, False),  # 1 day < 3 interval
+            (5, 7, False),  # do_not_contact_until in future
+            (5, -7, True),  # do_not_contact_until in past
+        ],
+        ids=[
+            "no_last_touch",
+            "sufficient_gap",
+            "insufficient_gap",
+            "do_not_contact_future",
+            "do_not_contact_past",
+        ],
+    )
+    def test_cooling_off(
+        self,
+        evaluator,
+        sample_evaluate_gates_request_ro,
+        last_touch_days_ago,
+        do_not_contact_days,
+        expected_passed,
     ):
-        """Test cooling off fails when do_not_contact_until is in future."""
-        future_date = (datetime.now(timezone.utc) + timedelta(days=7)).strftime("%Y-%m-%d")
-        sample_evaluate_gates_request.context.do_not_contact_until = future_date
-
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
-
-        assert result.gate_results["cooling_off"].passed is False
-
-    @pytest.mark.asyncio
-    async def test_cooling_off_do_not_contact_past(self, evaluator, sample_evaluate_gates_request):
-        """Test cooling off passes when do_not_contact_until is in past."""
-        past_date = (datetime.now(timezone.utc) - timedelta(days=7)).strftime("%Y-%m-%d")
-        sample_evaluate_gates_request.context.do_not_contact_until = past_date
-        sample_evaluate_gates_request.context.communication.last_touch_at = datetime.now(
-            timezone.utc
-        ) - timedelta(days=5)
-        sample_evaluate_gates_request.context.touch_interval_days = 3
+        """Test cooling off respects the touch interval and do_not_contact_until holds."""
+        request = _with(
+            sample_evaluate_gates_request_ro,
+            communication={
+                "last_touch_at": (
+                    NOW - timedelta(days=last_touch_days_ago)
+                    if last_touch_days_ago is not None
+                    else None
+                )
+            },
+            touch_interval_days=3,
+            do_not_contact_until=(
+                (NOW + timedelta(days=do_not_contact_days)).date()
+                if do_not_contact_days is not None
+                else None
+            ),
+        )
 
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
+        result = evaluator.evaluate_sync(request)
 
-        assert result.gate_results["cooling_off"].passed is True
+        assert result.gate_results["cooling_off"].passed is expected_passed
 
     # =========================================================================
-    # Dispute Gate (2 tests)
+    # Dispute / Unsubscribe Gates (2 cases each)
     # =========================================================================
 
-    @pytest.mark.asyncio
-    async def test_dispute_inactive(self, evaluator, sample_evaluate_gates_request):
-        """Test dispute gate passes when no active dispute."""
-        sample_evaluate_gates_request.context.active_dispute = False
-
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
-
-        assert result.gate_results["dispute_active"].passed is True
-
-    @pytest.mark.asyncio
-    async def test_dispute_active(self, evaluator, sample_evaluate_gates_request):
-        """Test dispute gate fails when dispute is active."""
-        sample_evaluate_gates_request.context.active_dispute = True
+    @pytest.mark.parametrize(
+        "active_dispute,expected_passed",
+        [(False, True), (True, False)],
+        ids=["inactive", "active"],
+    )
+    def test_dispute(
+        self, evaluator, sample_evaluate_gates_request_ro, active_dispute, expected_passed
+    ):
+        """Test dispute gate blocks contact only while a dispute is active."""
+        request = _with(sample_evaluate_gates_request_ro, active_dispute=active_dispute)
+
+        result = evaluator.evaluate_sync(request)
+
+        assert result.gate_results["dispute_active"].passed is expected_passed
+        if not expected_passed:
+            assert result.allowed is False
+
+    @pytest.mark.parametrize(
+        "unsubscribe_requested,expected_passed",
+        [(False, True), (True, False)],
+        ids=["not_requested", "requested"],
+    )
+    def test_unsubscribe(
+        self, evaluator, sample_evaluate_gates_request_ro, unsubscribe_requested, expected_passed
+    ):
+        """Test unsubscribe gate blocks contact once the party has opted out."""
+        request = _with(
+            sample_evaluate_gates_request_ro, unsubscribe_requested=unsubscribe_requested
+        )
 
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
+        result = evaluator.evaluate_sync(request)
 
-        assert result.gate_results["dispute_active"].passed is False
-        assert result.allowed is False
+        assert result.gate_results["unsubscribe"].passed is expected_passed
+        if not expected_passed:
+            assert result.allowed is False
 
     # =========================================================================
-    # Hardship Gate (2 tests)
+    # Hardship Gate (2 cases)
     # =========================================================================
 
-    @pytest.mark.asyncio
-    async def test_hardship_not_indicated(self, evaluator, sample_evaluate_gates_request):
-        """Test hardship gate passes when not indicated."""
-        sample_evaluate_gates_request.context.hardship_indicated = False
-
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
-
-        assert result.gate_results["hardship"].passed is True
-
-    @pytest.mark.asyncio
-    async def test_hardship_indicated_passes_with_warning(
-        self, evaluator, sample_evaluate_gates_request
+    @pytest.mark.parametrize(
+        "hardship_indicated,reason_fragment",
+        [(False, "no hardship"), (True, "sensitive tone")],
+        ids=["not_indicated", "indicated_passes_with_warning"],
+    )
+    def test_hardship(
+        self, evaluator, sample_evaluate_gates_request_ro, hardship_indicated, reason_fragment
     ):
-        """Test hardship gate passes (with warning) when indicated."""
-        sample_evaluate_gates_request.context.hardship_indicated = True
+        """Test hardship gate never blocks, but flags indicated hardship in its reason."""
+        request = _with(sample_evaluate_gates_request_ro, hardship_indicated=hardship_indicated)
 
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
+        result = evaluator.evaluate_sync(request)
 
         assert result.gate_results["hardship"].passed is True
-        assert "sensitive tone" in result.gate_results["hardship"].reason.lower()
+        assert reason_fragment in result.gate_results["hardship"].reason.lower()
 
     # =========================================================================
-    # Unsubscribe Gate (2 tests)
+    # Escalation Gate (9 cases, see ESCALATION_CASES)
     # =========================================================================
 
-    @pytest.mark.asyncio
-    async def test_unsubscribe_not_requested(self, evaluator, sample_evaluate_gates_request):
-        """Test unsubscribe gate passes when not requested."""
-        sample_evaluate_gates_request.context.unsubscribe_requested = False
-
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
-
-        assert result.gate_results["unsubscribe"].passed is True
-
-    @pytest.mark.asyncio
-    async def test_unsubscribe_requested(self, evaluator, sample_evaluate_gates_request):
-        """Test unsubscribe gate fails when requested."""
-        sample_evaluate_gates_request.context.unsubscribe_requested = True
+    @pytest.mark.parametrize(
+        "touch_count,last_tone,proposed_tone,escalation_patience,broken_promises,expected_passed",
+        [case[1:] for case in ESCALATION_CASES],
+        ids=[case[0] for case in ESCALATION_CASES],
+    )
+    def test_escalation(
+        self,
+        evaluator,
+        sample_evaluate_gates_request_ro,
+        touch_count,
+        last_tone,
+        proposed_tone,
+        escalation_patience,
+        broken_promises,
+        expected_passed,
+    ):
+        """Test escalation gate against the tone-ladder spec in ESCALATION_CASES."""
+        request = _with(
+            sample_evaluate_gates_request_ro,
+            proposed_tone=proposed_tone,
+            communication={"touch_count": touch_count, "last_tone_used": last_tone},
+            broken_promises_count=broken_promises,
+            industry=INDUSTRIES[escalation_patience],
+        )
 
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
+        result = evaluator.evaluate_sync(request)
 
-        assert result.gate_results["unsubscribe"].passed is False
-        assert result.allowed is False
+        assert result.gate_results["escalation_appropriate"].passed is expected_passed
 
     # =========================================================================
-    # Escalation Gate (9 tests)
+    # Combined Scenarios (4 tests)
     # =========================================================================
 
-    @pytest.mark.asyncio
-    async def test_escalation_first_contact_friendly(
-        self, evaluator, sample_evaluate_gates_request
-    ):
-        """Test first contact with friendly_reminder passes."""
-        sample_evaluate_gates_request.context.communication.touch_count = 0
-        sample_evaluate_gates_request.context.communication.last_tone_used = None
-        sample_evaluate_gates_request.proposed_tone = "friendly_reminder"
-
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
-
-        assert result.gate_results["escalation_appropriate"].passed is True
-
-    @pytest.mark.asyncio
-    async def test_escalation_first_contact_firm_fails(
-        self, evaluator, sample_evaluate_gates_request
-    ):
-        """Test first contact with firm tone fails."""
-        sample_evaluate_gates_request.context.communication.touch_count = 0
-        sample_evaluate_gates_request.context.communication.last_tone_used = None
-        sample_evaluate_gates_request.proposed_tone = "firm"
-
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
-
-        assert result.gate_results["escalation_appropriate"].passed is False
-
-    @pytest.mark.asyncio
-    async def test_escalation_first_contact_final_notice_fails(
-        self, evaluator, sample_evaluate_gates_request
-    ):
-        """Test first contact with final_notice fails."""
-        sample_evaluate_gates_request.context.communication.touch_count = 0
-        sample_evaluate_gates_request.context.communication.last_tone_used = None
-        sample_evaluate_gates_request.proposed_tone = "final_notice"
-
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
-
-        assert result.gate_results["escalation_appropriate"].passed is False
-
-    @pytest.mark.asyncio
-    async def test_escalation_single_step_standard(self, evaluator, sample_evaluate_gates_request):
-        """Test single-step escalation professional→firm passes (standard industry)."""
-        sample_evaluate_gates_request.context.communication.touch_count = 3
-        sample_evaluate_gates_request.context.communication.last_tone_used = "professional"
-        sample_evaluate_gates_request.proposed_tone = "firm"
-
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
-
-        assert result.gate_results["escalation_appropriate"].passed is True
-
-    @pytest.mark.asyncio
-    async def test_escalation_double_step_standard_no_broken_promises_fails(
-        self, evaluator, sample_evaluate_gates_request
-    ):
-        """Test double-step escalation professional→firm fails (standard, no broken promises).
-
-        Tone order: friendly(0), professional(1), concerned(2), firm(3), final(4).
-        professional(1)→firm(3) = jump of 2. Standard allows max 1 (no broken promises).
-        """
-        sample_evaluate_gates_request.context.communication.touch_count = 3
-        sample_evaluate_gates_request.context.communication.last_tone_used = "professional"
-        sample_evaluate_gates_request.context.broken_promises_count = 0
-        sample_evaluate_gates_request.context.industry = None
-        sample_evaluate_gates_request.proposed_tone = "firm"
+    def test_combined_all_pass(self, evaluator, sample_evaluate_gates_request_ro):
+        """Test all gates pass → allowed=True."""
+        request = _with(
+            sample_evaluate_gates_request_ro,
+            proposed_tone="professional",
+            communication={"touch_count": 3, "last_tone_used": "friendly_reminder"},
+            monthly_touch_count=0,
+            touch_cap=10,
+            active_dispute=False,
+            hardship_indicated=False,
+            unsubscribe_requested=False,
+            do_not_contact_until=None,
+        )
 
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
+        result = evaluator.evaluate_sync(request)
 
-        assert result.gate_results["escalation_appropriate"].passed is False
+        assert result.allowed is True
+        assert_all_gates_pass(result)
 
-    @pytest.mark.asyncio
-    async def test_escalation_double_step_aggressive_industry(
-        self, evaluator, sample_evaluate_gates_request
-    ):
-        """Test double-step escalation passes with aggressive industry (professional→firm, jump=2).
-
-        Tone order: friendly(0), professional(1), concerned(2), firm(3), final(4).
-        professional(1)→firm(3) = jump of 2. Aggressive allows max 2.
-        """
-        from src.api.models.requests import IndustryInfo
-
-        sample_evaluate_gates_request.context.communication.touch_count = 3
-        sample_evaluate_gates_request.context.communication.last_tone_used = "professional"
-        sample_evaluate_gates_request.context.industry = IndustryInfo(
-            code="retail",
-            name="Retail",
-            typical_dso_days=30,
-            alarm_dso_days=45,
-            payment_cycle="net30",
-            escalation_patience="aggressive",
+    def test_combined_multiple_failures(self, evaluator, sample_evaluate_gates_request_ro):
+        """Test multiple gate failures → allowed=False with all failures in results."""
+        request = _with(
+            sample_evaluate_gates_request_ro,
+            monthly_touch_count=10,
+            touch_cap=10,
+            active_dispute=True,
+            unsubscribe_requested=True,
         )
-        sample_evaluate_gates_request.proposed_tone = "firm"
 
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
+        result = evaluator.evaluate_sync(request)
 
-        assert result.gate_results["escalation_appropriate"].passed is True
+        assert result.allowed is False
+        assert result.passed_mask & (TOUCH_CAP_BIT | DISPUTE_ACTIVE_BIT | UNSUBSCRIBE_BIT) == 0
+        assert result.passed_mask & COOLING_OFF_BIT
 
-    @pytest.mark.asyncio
-    async def test_escalation_single_step_patient_industry(
-        self, evaluator, sample_evaluate_gates_request
-    ):
-        """Test single-step escalation firm→final_notice passes with patient industry."""
-        from src.api.models.requests import IndustryInfo
-
-        sample_evaluate_gates_request.context.communication.touch_count = 5
-        sample_evaluate_gates_request.context.communication.last_tone_used = "firm"
-        sample_evaluate_gates_request.context.industry = IndustryInfo(
-            code="manufacturing",
-            name="Manufacturing",
-            typical_dso_days=60,
-            alarm_dso_days=90,
-            payment_cycle="net60",
-            escalation_patience="patient",
+    def test_combined_hardship_warning_only(self, evaluator, sample_evaluate_gates_request_ro):
+        """Test only hardship warning → allowed=True (hardship doesn't block)."""
+        request = _with(
+            sample_evaluate_gates_request_ro,
+            proposed_tone="professional",
+            communication={"touch_count": 3, "last_tone_used": "friendly_reminder"},
+            monthly_touch_count=0,
+            touch_cap=10,
+            active_dispute=False,
+            hardship_indicated=True,
+            unsubscribe_requested=False,
+            do_not_contact_until=None,
         )
-        sample_evaluate_gates_request.proposed_tone = "final_notice"
 
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
+        result = evaluator.evaluate_sync(request)
 
-        assert result.gate_results["escalation_appropriate"].passed is True
+        assert result.allowed is True
+        assert_all_gates_pass(result)
 
-    @pytest.mark.asyncio
-    async def test_escalation_de_escalation_allowed(self, evaluator, sample_evaluate_gates_request):
-        """Test de-escalation firm→friendly_reminder always passes."""
-        sample_evaluate_gates_request.context.communication.touch_count = 3
-        sample_evaluate_gates_request.context.communication.last_tone_used = "firm"
-        sample_evaluate_gates_request.proposed_tone = "friendly_reminder"
+    def test_combined_batch(self, evaluator, sample_evaluate_gates_request_ro):
+        """Test evaluate_many returns one result per request, in order."""
+        blocked = _with(sample_evaluate_gates_request_ro, unsubscribe_requested=True)
 
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
+        results = evaluator.evaluate_many([sample_evaluate_gates_request_ro, blocked])
 
-        assert result.gate_results["escalation_appropriate"].passed is True
+        assert [r.allowed for r in results] == [True, False]
+        assert results[1].gate_results["unsubscribe"].passed is False
 
-    @pytest.mark.asyncio
-    async def test_escalation_double_step_broken_promises_standard(
-        self, evaluator, sample_evaluate_gates_request
-    ):
-        """Test double-step escalation passes with broken promises (professional→firm, jump=2).
+    # =========================================================================
+    # Memoization (2 tests)
+    # =========================================================================
 
-        Tone order: friendly(0), professional(1), concerned(2), firm(3), final(4).
-        professional(1)→firm(3) = jump of 2. Standard allows 2 with broken promises.
-        """
-        sample_evaluate_gates_request.context.communication.touch_count = 3
-        sample_evaluate_gates_request.context.communication.last_tone_used = "professional"
-        sample_evaluate_gates_request.context.broken_promises_count = 2
-        sample_evaluate_gates_request.context.industry = None
-        sample_evaluate_gates_request.proposed_tone = "firm"
+    def test_repeated_evaluation_is_memoized(self, sample_evaluate_gates_request_ro):
+        """Test identical inputs reuse cached gate results without sharing the mapping."""
+        evaluator = GateEvaluator(clock=lambda: NOW)
+
+        first = evaluator.evaluate_sync(sample_evaluate_gates_request_ro)
+        second = evaluator.evaluate_sync(sample_evaluate_gates_request_ro)
+
+        assert evaluator._evaluate_gates_cached.cache_info().hits == 1
+        assert second.gate_results == first.gate_results
+        assert second.gate_results is not first.gate_results
+
+    def test_memoization_respects_clock(self, sample_evaluate_gates_request_ro):
+        """Test cooling off is re-derived from the clock rather than served stale."""
+        current = {"now": NOW}
+        evaluator = GateEvaluator(clock=lambda: current["now"])
+        request = _with(
+            sample_evaluate_gates_request_ro,
+            communication={"last_touch_at": NOW},
+            touch_interval_days=3,
+        )
 
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
+        before = evaluator.evaluate_sync(request)
+        current["now"] = NOW + timedelta(days=3)
+        after = evaluator.evaluate_sync(request)
 
-        assert result.gate_results["escalation_appropriate"].passed is True
+        assert before.gate_results["cooling_off"].passed is False
+        assert after.gate_results["cooling_off"].passed is True
 
     # =========================================================================
-    # Combined Scenarios (3 tests)
+    # Fast Path (7 cases)
     # =========================================================================
 
-    @pytest.mark.asyncio
-    async def test_combined_all_pass(self, evaluator, sample_evaluate_gates_request):
-        """Test all gates pass → allowed=True."""
-        sample_evaluate_gates_request.context.monthly_touch_count = 0
-        sample_evaluate_gates_request.context.touch_cap = 10
-        sample_evaluate_gates_request.context.active_dispute = False
-        sample_evaluate_gates_request.context.hardship_indicated = False
-        sample_evaluate_gates_request.context.unsubscribe_requested = False
-        sample_evaluate_gates_request.context.do_not_contact_until = None
-        sample_evaluate_gates_request.context.communication.touch_count = 3
-        sample_evaluate_gates_request.context.communication.last_tone_used = "friendly_reminder"
-        sample_evaluate_gates_request.proposed_tone = "professional"
-
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
-
-        assert isinstance(result, EvaluateGatesResponse)
-        assert result.allowed is True
-        assert all(g.passed for g in result.gate_results.values())
-
-    @pytest.mark.asyncio
-    async def test_combined_multiple_failures(self, evaluator, sample_evaluate_gates_request):
-        """Test multiple gate failures → allowed=False with all failures in results."""
-        sample_evaluate_gates_request.context.monthly_touch_count = 10
-        sample_evaluate_gates_request.context.touch_cap = 10
-        sample_evaluate_gates_request.context.active_dispute = True
-        sample_evaluate_gates_request.context.unsubscribe_requested = True
+    def test_fast_path_stops_at_first_failure(self, evaluator, sample_evaluate_gates_request_ro):
+        """Test full_report=False returns as soon as a cheap blocking gate fails."""
+        request = _with(
+            sample_evaluate_gates_request_ro, active_dispute=True, unsubscribe_requested=False
+        )
 
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
+        result = evaluator.evaluate_sync(request, full_report=False)
 
-        assert isinstance(result, EvaluateGatesResponse)
         assert result.allowed is False
-        assert result.gate_results["touch_cap"].passed is False
-        assert result.gate_results["dispute_active"].passed is False
-        assert result.gate_results["unsubscribe"].passed is False
+        assert list(result.gate_results) == ["unsubscribe", "dispute_active"]
+        assert result.recommended_action == "Wait for dispute resolution before contact"
+
+    @pytest.mark.parametrize(
+        "context_overrides,proposed_tone",
+        [
+            ({"unsubscribe_requested": True, "monthly_touch_count": 10}, None),
+            ({"active_dispute": True, "monthly_touch_count": 10}, None),
+            (
+                {
+                    "do_not_contact_until": (NOW + timedelta(days=7)).date(),
+                    "monthly_touch_count": 10,
+                },
+                None,
+            ),
+            ({"monthly_touch_count": 10}, "final_notice"),
+            ({}, "final_notice"),  # Only a non-fast-fail gate fails
+        ],
+        ids=[
+            "unsubscribe_and_touch_cap",
+            "dispute_and_touch_cap",
+            "do_not_contact_and_touch_cap",
+            "touch_cap_and_escalation",
+            "escalation_only",
+        ],
+    )
+    def test_fast_path_recommends_like_full_report(
+        self, evaluator, sample_evaluate_gates_request_ro, context_overrides, proposed_tone
+    ):
+        """Test a blocked fast path gives the full report's recommended action."""
+        request = _with(
+            sample_evaluate_gates_request_ro,
+            proposed_tone=proposed_tone,
+            touch_cap=10,
+            **context_overrides,
+        )
 
-    @pytest.mark.asyncio
-    async def test_combined_hardship_warning_only(self, evaluator, sample_evaluate_gates_request):
-        """Test only hardship warning → allowed=True (hardship doesn't block)."""
-        sample_evaluate_gates_request.context.monthly_touch_count = 0
-        sample_evaluate_gates_request.context.touch_cap = 10
-        sample_evaluate_gates_request.context.active_dispute = False
-        sample_evaluate_gates_request.context.hardship_indicated = True
-        sample_evaluate_gates_request.context.unsubscribe_requested = False
-        sample_evaluate_gates_request.context.do_not_contact_until = None
-        sample_evaluate_gates_request.context.communication.touch_count = 3
-        sample_evaluate_gates_request.context.communication.last_tone_used = "friendly_reminder"
-        sample_evaluate_gates_request.proposed_tone = "professional"
-
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
-
-        assert isinstance(result, EvaluateGatesResponse)
-        assert result.allowed is True
-        assert result.gate_results["hardship"].passed is True
+        fast = evaluator.evaluate_sync(request, full_report=False)
+        full = evaluator.evaluate_sync(request)
+
+        assert fast.allowed is full.allowed is False
+        assert fast.recommended_action == full.recommended_action
+
+    def test_fast_path_allowed_is_full_report(self, evaluator, sample_evaluate_gates_request_ro):
+        """Test full_report=False still reports every gate when the action is allowed."""
+        fast = evaluator.evaluate_sync(sample_evaluate_gates_request_ro, full_report=False)
+        full = evaluator.evaluate_sync(sample_evaluate_gates_request_ro)
+
+        assert fast.allowed is full.allowed is True
+        assert fast.gate_results == full.gate_results
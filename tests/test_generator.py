@@ -1,100 +1,69 @@
 """Unit tests for DraftGenerator."""
 
-import json
-from unittest.mock import AsyncMock, patch
-
 import pytest
 
-from src.api.models.responses import GenerateDraftResponse
-from src.engine.generator import DraftGenerator
-from src.llm.base import LLMResponse
-
-
-def _make_llm_response(content: dict, tokens: int = 100) -> LLMResponse:
-    """Helper to create mock LLMResponse objects."""
-    return LLMResponse(
-        content=json.dumps(content),
-        model="test-model",
-        provider="test",
-        usage={"total_tokens": tokens},
-    )
+from tests.helpers import make_llm_response
+
+INVOICES_DRAFT_RESPONSE = make_llm_response(
+    {
+        "subject": "Overdue Invoices",
+        "body": "Dear Customer, Please pay invoice INV-12345 immediately. INV-12346 is also overdue.",
+    },
+    tokens=150,
+)
+TONE_DRAFT_RESPONSES = {
+    tone: make_llm_response({"subject": f"{tone} subject", "body": f"Body with {tone} tone."})
+    for tone in ("friendly_reminder", "professional", "urgent")
+}
+NO_INVOICES_DRAFT_RESPONSE = make_llm_response(
+    {
+        "subject": "Payment Reminder",
+        "body": "Dear Customer, Please contact us to discuss your account.",
+    }
+)
 
 
 class TestDraftGenerator:
     """Tests for DraftGenerator."""
 
-    @pytest.fixture
-    def generator(self):
-        """Create generator instance."""
-        return DraftGenerator()
-
     @pytest.mark.asyncio
     async def test_generate_draft_referencing_invoices(
-        self, generator, sample_generate_draft_request
+        self, generator, sample_generate_draft_request_ro, mock_llm_complete
     ):
         """Test draft generation references specific invoices."""
-        sample_generate_draft_request.tone = "firm"
+        request = sample_generate_draft_request_ro.model_copy(update={"tone": "firm"})
 
         # Mock LLM response containing invoice numbers
-        mock_response = _make_llm_response(
-            {
-                "subject": "Overdue Invoices",
-                "body": "Dear Customer, Please pay invoice INV-12345 immediately. INV-12346 is also overdue.",
-            },
-            tokens=150,
-        )
-
-        with patch(
-            "src.engine.generator.llm_client.complete", new_callable=AsyncMock
-        ) as mock_complete:
-            mock_complete.return_value = mock_response
+        mock_llm_complete.return_value = INVOICES_DRAFT_RESPONSE
 
-            result = await generator.generate(sample_generate_draft_request)
+        result = await generator.generate(request)
 
-            assert isinstance(result, GenerateDraftResponse)
-            assert result.tone_used == "firm"
-            # Verify invoices are detected in the body
-            assert "INV-12345" in result.invoices_referenced
-            assert "INV-12346" in result.invoices_referenced
+        assert result.tone_used == "firm"
+        # Verify invoices are detected in the body
+        assert "INV-12345" in result.invoices_referenced
+        assert "INV-12346" in result.invoices_referenced
 
     @pytest.mark.asyncio
-    async def test_generate_draft_different_tones(self, generator, sample_generate_draft_request):
+    async def test_generate_draft_different_tones(
+        self, generator, sample_generate_draft_request_ro, mock_llm_complete
+    ):
         """Test draft generation with different tones."""
-        tones = ["friendly_reminder", "professional", "urgent"]
-
-        with patch(
-            "src.engine.generator.llm_client.complete", new_callable=AsyncMock
-        ) as mock_complete:
-            for tone in tones:
-                sample_generate_draft_request.tone = tone
-                mock_complete.return_value = _make_llm_response(
-                    {
-                        "subject": f"{tone} subject",
-                        "body": f"Body with {tone} tone.",
-                    }
-                )
+        for tone, response in TONE_DRAFT_RESPONSES.items():
+            request = sample_generate_draft_request_ro.model_copy(update={"tone": tone})
+            mock_llm_complete.return_value = response
 
-                result = await generator.generate(sample_generate_draft_request)
+            result = await generator.generate(request)
 
-                assert result.tone_used == tone
-                assert result.body == f"Body with {tone} tone."
+            assert result.tone_used == tone
+            assert result.body == f"Body with {tone} tone."
 
     @pytest.mark.asyncio
-    async def test_generate_draft_no_invoices(self, generator, sample_generate_draft_request):
+    async def test_generate_draft_no_invoices(
+        self, generator, sample_generate_draft_request_ro, mock_llm_complete
+    ):
         """Test draft generation when no invoices are referenced."""
-        mock_response = _make_llm_response(
-            {
-                "subject": "Payment Reminder",
-                "body": "Dear Customer, Please contact us to discuss your account.",
-            }
-        )
-
-        with patch(
-            "src.engine.generator.llm_client.complete", new_callable=AsyncMock
-        ) as mock_complete:
-            mock_complete.return_value = mock_response
+        mock_llm_complete.return_value = NO_INVOICES_DRAFT_RESPONSE
 
-            result = await generator.generate(sample_generate_draft_request)
+        result = await generator.generate(sample_generate_draft_request_ro)
 
-            assert isinstance(result, GenerateDraftResponse)
-            assert len(result.invoices_referenced) == 0
+        assert len(result.invoices_referenced) == 0
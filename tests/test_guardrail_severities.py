@@ -7,7 +7,8 @@ Validates:
 - Pipeline behavior with mixed severities
 """
 
-from src.api.models.requests import CaseContext, ObligationInfo, PartyInfo
+import pytest
+
 from src.guardrails.base import GuardrailResult, GuardrailSeverity
 from src.guardrails.contextual import ContextualCoherenceGuardrail
 from src.guardrails.entity import EntityVerificationGuardrail
@@ -15,114 +16,78 @@ from src.guardrails.pipeline import GuardrailPipeline
 from src.guardrails.temporal import TemporalConsistencyGuardrail
 
 
-class TestGuardrailSeverities:
-    """Test that guardrail severities match documented values."""
+@pytest.fixture(scope="module")
+def guardrails():
+    """One instance of each real guardrail, keyed by short name (read-only)."""
+    return {
+        "entity": EntityVerificationGuardrail(),
+        "temporal": TemporalConsistencyGuardrail(),
+        "contextual": ContextualCoherenceGuardrail(),
+    }
 
-    def test_entity_severity_is_high(self):
-        """Entity guardrail should be HIGH severity."""
-        guardrail = EntityVerificationGuardrail()
-        assert guardrail.severity == GuardrailSeverity.HIGH
 
-    def test_temporal_severity_is_medium(self):
-        """Temporal guardrail should be MEDIUM severity."""
-        guardrail = TemporalConsistencyGuardrail()
-        assert guardrail.severity == GuardrailSeverity.MEDIUM
+# (guardrail_name, severity, message) for failures that must not block
+NON_BLOCKING_FAILURES = [
+    ("temporal_consistency", GuardrailSeverity.MEDIUM, "Date mismatch"),
+    ("contextual_coherence", GuardrailSeverity.LOW, "Tone mismatch"),
+]
 
-    def test_contextual_severity_is_low(self):
-        """Contextual guardrail should be LOW severity."""
-        guardrail = ContextualCoherenceGuardrail()
-        assert guardrail.severity == GuardrailSeverity.LOW
 
-    def test_temporal_failure_does_not_block(self):
-        """MEDIUM severity failure should not have should_block=True."""
-        result = GuardrailResult(
-            passed=False,
-            guardrail_name="temporal_consistency",
-            severity=GuardrailSeverity.MEDIUM,
-            message="Date mismatch",
-        )
-        assert result.should_block is False
+class AlwaysFailGuardrail:
+    """Stub guardrail that always fails with the given name and severity."""
 
-    def test_contextual_failure_does_not_block(self):
-        """LOW severity failure should not have should_block=True."""
-        result = GuardrailResult(
-            passed=False,
-            guardrail_name="contextual_coherence",
-            severity=GuardrailSeverity.LOW,
-            message="Tone mismatch",
-        )
-        assert result.should_block is False
+    def __init__(self, name: str, severity: GuardrailSeverity, message: str):
+        self.name = name
+        self.severity = severity
+        self.message = message
 
-    def test_pipeline_temporal_only_fails_not_blocked(self):
-        """Pipeline with only temporal (MEDIUM) failure should not block."""
-
-        # Create a mock guardrail that always fails with MEDIUM severity
-        class AlwaysFailMedium:
-            name = "temporal_consistency"
-            severity = GuardrailSeverity.MEDIUM
-
-            def validate(self, output, context, **kwargs):
-                return [
-                    GuardrailResult(
-                        passed=False,
-                        guardrail_name=self.name,
-                        severity=self.severity,
-                        message="Date mismatch",
-                    )
-                ]
-
-        pipeline = GuardrailPipeline(guardrails=[AlwaysFailMedium()])
-        context = CaseContext(
-            party=PartyInfo(party_id="p1", customer_code="C1", name="Test Corp"),
-            obligations=[
-                ObligationInfo(
-                    invoice_number="INV-1",
-                    original_amount=100,
-                    amount_due=100,
-                    due_date="2024-01-01",
-                    days_past_due=30,
-                )
-            ],
-        )
+    def validate(self, output, context, **kwargs):
+        return [
+            GuardrailResult(
+                passed=False,
+                guardrail_name=self.name,
+                severity=self.severity,
+                message=self.message,
+            )
+        ]
 
-        result = pipeline.validate("test output", context, parallel=False)
 
-        assert result.all_passed is False
+class TestGuardrailSeverities:
+    """Test that guardrail severities match documented values."""
+
+    @pytest.mark.parametrize(
+        "name,expected_severity",
+        [
+            ("entity", GuardrailSeverity.HIGH),
+            ("temporal", GuardrailSeverity.MEDIUM),
+            ("contextual", GuardrailSeverity.LOW),
+        ],
+    )
+    def test_guardrail_severity(self, guardrails, name, expected_severity):
+        """Entity is HIGH, temporal MEDIUM and contextual LOW severity."""
+        assert guardrails[name].severity == expected_severity
+
+    @pytest.mark.parametrize("guardrail_name,severity,message", NON_BLOCKING_FAILURES)
+    def test_non_blocking_failure_does_not_block(self, guardrail_name, severity, message):
+        """MEDIUM and LOW severity failures should not have should_block=True."""
+        result = GuardrailResult(
+            passed=False,
+            guardrail_name=guardrail_name,
+            severity=severity,
+            message=message,
+        )
         assert result.should_block is False
-        assert len(result.blocking_guardrails) == 0
 
-    def test_pipeline_contextual_only_fails_not_blocked(self):
-        """Pipeline with only contextual (LOW) failure should not block."""
-
-        class AlwaysFailLow:
-            name = "contextual_coherence"
-            severity = GuardrailSeverity.LOW
-
-            def validate(self, output, context, **kwargs):
-                return [
-                    GuardrailResult(
-                        passed=False,
-                        guardrail_name=self.name,
-                        severity=self.severity,
-                        message="Tone mismatch",
-                    )
-                ]
-
-        pipeline = GuardrailPipeline(guardrails=[AlwaysFailLow()])
-        context = CaseContext(
-            party=PartyInfo(party_id="p1", customer_code="C1", name="Test Corp"),
-            obligations=[
-                ObligationInfo(
-                    invoice_number="INV-1",
-                    original_amount=100,
-                    amount_due=100,
-                    due_date="2024-01-01",
-                    days_past_due=30,
-                )
-            ],
+    @pytest.mark.parametrize("guardrail_name,severity,message", NON_BLOCKING_FAILURES)
+    def test_pipeline_non_blocking_failure_not_blocked(
+        self, minimal_case_context, guardrail_name, severity, message
+    ):
+        """Pipeline with only a MEDIUM or LOW severity failure should not block."""
+        pipeline = GuardrailPipeline(
+            guardrails=[AlwaysFailGuardrail(guardrail_name, severity, message)]
         )
 
-        result = pipeline.validate("test output", context, parallel=False)
+        result = pipeline.validate("test output", minimal_case_context, parallel=False)
 
         assert result.all_passed is False
         assert result.should_block is False
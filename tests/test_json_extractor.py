@@ -0,0 +1,95 @@
+"""Unit tests for extract_json (robust JSON extraction from LLM responses)."""
+
+import pytest
+
+from src.utils.json_extractor import JSONExtractionError, extract_json
+
+PAYLOAD = '{"classification": "HARDSHIP", "confidence": 0.9}'
+EXPECTED = {"classification": "HARDSHIP", "confidence": 0.9}
+
+
+class TestExtractJson:
+    """Tests for each extraction strategy and the failure reporting."""
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            PAYLOAD,
+            f"```json\n{PAYLOAD}\n```",  # Fenced code block
+            f"```\n{PAYLOAD}\n```",  # Fence without a language
+            f"\ufeff{PAYLOAD}",  # Leading BOM
+            f"Here is the result: {PAYLOAD} Let me know!",  # Surrounding prose
+            '{"classification": "HARDSHIP", "confidence": 0.9,}',  # Trailing comma
+            '```json\n{"classification": "HARDSHIP", "confidence": 0.9,}\n```',
+        ],
+        ids=[
+            "clean",
+            "fenced",
+            "fenced_no_language",
+            "bom_prefixed",
+            "surrounding_text",
+            "trailing_comma",
+            "fenced_trailing_comma",
+        ],
+    )
+    def test_extracts_dict(self, content):
+        """Test every supported response shape parses to the same dict."""
+        assert extract_json(content) == EXPECTED
+
+    @pytest.mark.parametrize(
+        "content",
+        [PAYLOAD.encode(), bytearray(PAYLOAD.encode()), memoryview(PAYLOAD.encode())],
+        ids=["bytes", "bytearray", "memoryview"],
+    )
+    def test_accepts_binary_input(self, content):
+        """Test undecoded bodies are decoded as UTF-8 before parsing."""
+        assert extract_json(content) == EXPECTED
+
+    def test_decodes_non_ascii_utf8(self):
+        """Test multi-byte UTF-8 characters survive the bytes path."""
+        assert extract_json('{"name": "Café"}'.encode()) == {"name": "Café"}
+
+    def test_invalid_utf8_raises(self):
+        """Test invalid UTF-8 is rejected instead of parsed with replacement chars."""
+        with pytest.raises(JSONExtractionError) as exc_info:
+            extract_json(b'{"name": "Caf\xe9"}')
+
+        error = exc_info.value
+        assert str(error) == "LLM response is not valid UTF-8"
+        assert len(error.attempts) == 1
+        assert error.attempts[0].startswith("UTF-8 decode failed:")
+        assert "\ufffd" in error.raw_content
+
+    @pytest.mark.parametrize(
+        "content", ["", "   \n\t", b"  "], ids=["empty", "whitespace", "bytes"]
+    )
+    def test_empty_content_raises(self, content):
+        """Test empty or whitespace-only content fails without parse attempts."""
+        with pytest.raises(JSONExtractionError) as exc_info:
+            extract_json(content)
+
+        assert exc_info.value.attempts == ["Content was empty or whitespace only"]
+
+    @pytest.mark.parametrize(
+        "content,expected_attempts",
+        [
+            ("not json at all", ["Direct parse failed: Expecting value: line 1 column 1 (char 0)"]),
+            ("[1, 2]", ["Direct parse returned list, not dict"]),
+            (
+                "```json\n[1,]\n```",
+                [
+                    "Direct parse failed: Expecting value: line 1 column 1 (char 0)",
+                    "Stripped markdown parse failed: Expecting value: line 1 column 4 (char 3)",
+                    "Cleaned content parse returned list, not dict",
+                ],
+            ),
+        ],
+        ids=["prose", "top_level_list", "fenced_list"],
+    )
+    def test_failure_reports_attempts(self, content, expected_attempts):
+        """Test failures record one entry per distinct candidate tried, in order."""
+        with pytest.raises(JSONExtractionError) as exc_info:
+            extract_json(content)
+
+        assert exc_info.value.raw_content == content
+        assert exc_info.value.attempts == expected_attempts
@@ -9,8 +9,11 @@ from src.engine.classifier import classifier
 from src.engine.gate_evaluator import gate_evaluator
 from src.engine.generator import generator
 
-# Skip all tests in this module if no API key
-pytestmark = pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), reason="OPENAI_API_KEY not set")
+# Skip all tests in this module if no API key; keep real retry backoff against the live API
+pytestmark = [
+    pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), reason="OPENAI_API_KEY not set"),
+    pytest.mark.real_sleep,
+]
 
 # Note: max_tokens is configured in the factory/provider settings
 
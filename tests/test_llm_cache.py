@@ -0,0 +1,92 @@
+"""Unit tests for LLMCache and its use in the classifier (drafts are never cached)."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.engine.generator import DraftGenerator
+from src.utils.llm_cache import LLMCache, llm_cache
+from tests.helpers import PASSING_GUARDRAILS, AsyncStub, make_llm_response
+
+
+class TestLLMCache:
+    """Tests for the prompt-hash keyed cache."""
+
+    def test_make_key_is_order_independent(self):
+        """Keys depend on the parts, not the keyword order."""
+        assert LLMCache.make_key(a=1, b="x") == LLMCache.make_key(b="x", a=1)
+        assert LLMCache.make_key(a=1, b="x") != LLMCache.make_key(a=1, b="y")
+
+    def test_get_returns_stored_value(self):
+        """Stored values are returned and counted as hits."""
+        cache = LLMCache()
+        cache.set("k", {"classification": "HARDSHIP"})
+
+        assert cache.get("k") == {"classification": "HARDSHIP"}
+        assert cache.get("missing") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_expired_entries_are_dropped(self):
+        """Entries past their TTL are treated as misses and removed."""
+        cache = LLMCache(ttl_seconds=-1)
+        cache.set("k", "value")
+
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_evicted(self):
+        """The cache never grows past max_entries."""
+        cache = LLMCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_disabled_cache_is_a_no_op(self):
+        """A disabled cache never stores or returns values."""
+        cache = LLMCache(enabled=False)
+        cache.set("k", "value")
+
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_classifier_reuses_cached_result(
+    classifier, sample_classify_request_ro, mock_llm_complete, monkeypatch
+):
+    """A repeated classification is served from cache without calling the LLM."""
+    mock_llm_complete.return_value = make_llm_response(
+        {"classification": "HARDSHIP", "confidence": 0.9}
+    )
+
+    # Opt in to the shared cache (conftest disables and empties it per test)
+    monkeypatch.setattr(llm_cache, "enabled", True)
+
+    first = await classifier.classify(sample_classify_request_ro)
+    second = await classifier.classify(sample_classify_request_ro)
+
+    assert mock_llm_complete.await_count == 1
+    assert second.classification == first.classification == "HARDSHIP"
+    assert second.tokens_used == 0
+
+
+@pytest.mark.asyncio
+async def test_generator_bypasses_cache(sample_generate_draft_request_ro, monkeypatch):
+    """Drafts are generated at temperature 0.7, so a repeat always calls the LLM."""
+    complete = AsyncStub(make_llm_response({"subject": "Reminder", "body": "Please pay."}))
+    generator = DraftGenerator(
+        llm=SimpleNamespace(complete=complete, primary_provider_name="test"),
+        guardrails=PASSING_GUARDRAILS,
+    )
+    # Opt in to the shared cache (conftest disables and empties it per test)
+    monkeypatch.setattr(llm_cache, "enabled", True)
+
+    await generator.generate(sample_generate_draft_request_ro)
+    await generator.generate(sample_generate_draft_request_ro)
+
+    assert complete.await_count == 2
@@ -15,6 +15,10 @@ import pytest
 from src.llm.factory import LLMProviderWithFallback
 from src.llm.gemini_provider import GeminiProvider
 from src.llm.openai_provider import OpenAIProvider
+from src.prompts import CLASSIFY_EMAIL_SYSTEM, CLASSIFY_EMAIL_USER
+
+# Real provider calls: keep tenacity's retry backoff (see conftest._no_sleep)
+pytestmark = pytest.mark.real_sleep
 
 
 class TestLLMProviders:
@@ -124,8 +128,6 @@ class TestLLMProviders:
     @pytest.mark.asyncio
     async def test_classification_with_openai(self, sample_classify_request):
         """Test email classification using OpenAI."""
-        from src.prompts import CLASSIFY_EMAIL_SYSTEM, CLASSIFY_EMAIL_USER
-
         # Create OpenAI provider
         provider = OpenAIProvider()
 
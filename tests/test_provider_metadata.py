@@ -4,124 +4,118 @@ Validates that classify, generate, and gate evaluation responses
 include provider/model/is_fallback fields.
 """
 
-import json
-from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
+from typing import NamedTuple
 
 import pytest
 
-from src.api.models.responses import EvaluateGatesResponse
-from src.engine.gate_evaluator import GateEvaluator
-from src.llm.base import LLMResponse
+from src.engine.classifier import EmailClassifier
+from src.engine.generator import DraftGenerator
+from tests.helpers import CLASSIFICATION_RESPONSES, PASSING_GUARDRAILS, make_llm_response
+
+GEMINI_CLASSIFY_RESPONSE = make_llm_response(
+    CLASSIFICATION_RESPONSES["HARDSHIP"],
+    model="gemini-2.0-flash",
+    provider="gemini",
+    usage={"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150},
+)
+OPENAI_DRAFT_RESPONSE = make_llm_response(
+    {
+        "subject": "Outstanding Balance",
+        "body": "<p>Dear Customer,</p><p>Please pay.</p>",
+    },
+    model="gpt-4o-mini",
+    provider="openai",
+    usage={"prompt_tokens": 200, "completion_tokens": 100, "total_tokens": 300},
+)
+
+
+# Nothing here asserts on LLM calls, so plain coroutines stand in for complete()
+async def complete_from_gemini(*args, **kwargs):
+    return GEMINI_CLASSIFY_RESPONSE
+
+
+async def complete_from_openai(*args, **kwargs):
+    return OPENAI_DRAFT_RESPONSE
+
+
+@pytest.fixture(scope="module")
+def gemini_classifier() -> EmailClassifier:
+    """Classifier whose (injected) LLM answers from the primary provider."""
+    return EmailClassifier(
+        llm=SimpleNamespace(complete=complete_from_gemini, primary_provider_name="gemini"),
+        guardrails=PASSING_GUARDRAILS,
+    )
+
+
+@pytest.fixture(scope="module")
+def fallback_generator() -> DraftGenerator:
+    """Generator whose (injected) LLM answers from the openai fallback."""
+    return DraftGenerator(
+        llm=SimpleNamespace(
+            complete=complete_from_openai,
+            primary_provider_name="gemini",  # Primary is gemini
+        ),
+        guardrails=PASSING_GUARDRAILS,
+    )
+
+
+class MetadataScenario(NamedTuple):
+    """One engine call and the provider metadata its response should carry."""
+
+    engine_fixture: str
+    method: str
+    request_fixture: str
+    provider: str
+    model: str
+    is_fallback: bool
+
+    @property
+    def expected_metadata(self) -> tuple[str, str, bool]:
+        return self.provider, self.model, self.is_fallback
+
+
+METADATA_SCENARIOS = {
+    "classify": MetadataScenario(
+        "gemini_classifier",
+        "classify",
+        "sample_classify_request_ro",
+        "gemini",
+        "gemini-2.0-flash",
+        False,
+    ),
+    # openai != gemini (primary), so the draft is flagged as a fallback
+    "generate": MetadataScenario(
+        "fallback_generator",
+        "generate",
+        "sample_generate_draft_request_ro",
+        "openai",
+        "gpt-4o-mini",
+        True,
+    ),
+    # Gates never call an LLM
+    "gate": MetadataScenario(
+        "gate_evaluator",
+        "evaluate",
+        "sample_evaluate_gates_request_ro",
+        "deterministic",
+        "rule_engine",
+        False,
+    ),
+}
 
 
 class TestProviderMetadata:
     """Test that all response types include provider metadata."""
 
     @pytest.mark.asyncio
-    async def test_classify_response_includes_metadata(self, sample_classify_request):
-        """Classify response should include provider/model/is_fallback."""
-        from src.engine.classifier import EmailClassifier
-
-        mock_response = LLMResponse(
-            content=json.dumps(
-                {
-                    "classification": "HARDSHIP",
-                    "confidence": 0.9,
-                    "reasoning": "Customer mentions job loss",
-                    "extracted_data": {
-                        "promise_date": None,
-                        "promise_amount": None,
-                        "dispute_type": None,
-                        "dispute_reason": None,
-                        "redirect_contact": None,
-                        "redirect_email": None,
-                    },
-                }
-            ),
-            model="gemini-2.0-flash",
-            provider="gemini",
-            usage={"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150},
-        )
-
-        classifier = EmailClassifier()
-
-        with patch("src.engine.classifier.llm_client") as mock_llm:
-            mock_llm.complete = AsyncMock(return_value=mock_response)
-            mock_llm.primary_provider_name = "gemini"
-
-            with patch("src.engine.classifier.guardrail_pipeline") as mock_pipeline:
-                mock_result = type(
-                    "MockResult",
-                    (),
-                    {
-                        "all_passed": True,
-                        "results": [],
-                        "blocking_guardrails": [],
-                    },
-                )()
-                mock_pipeline.validate.return_value = mock_result
-
-                result = await classifier.classify(sample_classify_request)
-
-        assert result.provider == "gemini"
-        assert result.model == "gemini-2.0-flash"
-        assert result.is_fallback is False
+    @pytest.mark.parametrize("scenario", METADATA_SCENARIOS.values(), ids=METADATA_SCENARIOS.keys())
+    async def test_response_includes_metadata(self, request, scenario):
+        """Responses should include provider/model/is_fallback."""
+        engine = request.getfixturevalue(scenario.engine_fixture)
+        engine_request = request.getfixturevalue(scenario.request_fixture)
 
-    @pytest.mark.asyncio
-    async def test_generate_response_includes_metadata(self, sample_generate_draft_request):
-        """Generate response should include provider/model/is_fallback."""
-        from src.engine.generator import DraftGenerator
-
-        mock_response = LLMResponse(
-            content=json.dumps(
-                {
-                    "subject": "Outstanding Balance",
-                    "body": "<p>Dear Customer,</p><p>Please pay.</p>",
-                }
-            ),
-            model="gpt-4o-mini",
-            provider="openai",
-            usage={"prompt_tokens": 200, "completion_tokens": 100, "total_tokens": 300},
-        )
-
-        generator = DraftGenerator()
-
-        with patch("src.engine.generator.llm_client") as mock_llm:
-            mock_llm.complete = AsyncMock(return_value=mock_response)
-            mock_llm.primary_provider_name = "gemini"  # Primary is gemini
-
-            with patch("src.engine.generator.guardrail_pipeline") as mock_pipeline:
-                mock_result = type(
-                    "MockResult",
-                    (),
-                    {
-                        "all_passed": True,
-                        "results": [],
-                        "blocking_guardrails": [],
-                    },
-                )()
-                mock_pipeline.validate.return_value = mock_result
-
-                result = await generator.generate(sample_generate_draft_request)
-
-        assert result.provider == "openai"
-        assert result.model == "gpt-4o-mini"
-        assert result.is_fallback is True  # openai != gemini (primary)
+        result = await getattr(engine, scenario.method)(engine_request)
 
-    @pytest.mark.asyncio
-    async def test_gate_evaluation_returns_deterministic_metadata(
-        self, sample_evaluate_gates_request
-    ):
-        """Gate evaluation should return provider=deterministic, model=rule_engine."""
-        evaluator = GateEvaluator()
-
-        sample_evaluate_gates_request.context.monthly_touch_count = 0
-        sample_evaluate_gates_request.context.touch_cap = 10
-        sample_evaluate_gates_request.context.active_dispute = False
-
-        result = await evaluator.evaluate(sample_evaluate_gates_request)
-
-        assert isinstance(result, EvaluateGatesResponse)
-        assert result.provider == "deterministic"
-        assert result.model == "rule_engine"
-        assert result.is_fallback is False
+        metadata = (result.provider, result.model, result.is_fallback)
+        assert metadata == scenario.expected_metadata